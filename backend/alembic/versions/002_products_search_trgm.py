@@ -0,0 +1,43 @@
+"""Trigram index for product search
+
+Revision ID: 002
+Revises: 001
+Create Date: 2026-10-15
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "002"
+down_revision: Union[str, None] = "001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade database schema - index product search columns."""
+
+    # Trigram operators for substring (ILIKE '%q%') matching
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    # Create GIN trigram index on products.name and products.description
+    op.create_index(
+        "ix_products_search_trgm",
+        "products",
+        ["name", "description"],
+        postgresql_using="gin",
+        postgresql_ops={
+            "name": "gin_trgm_ops",
+            "description": "gin_trgm_ops",
+        },
+    )
+
+
+def downgrade() -> None:
+    """Downgrade database schema - drop product search index."""
+
+    # Drop indexes
+    op.drop_index("ix_products_search_trgm", table_name="products")
@@ -0,0 +1,53 @@
+"""Composite indexes for product listing
+
+Revision ID: 003
+Revises: 002
+Create Date: 2026-10-15
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "003"
+down_revision: Union[str, None] = "002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade database schema - index product listing filters."""
+
+    # Create index on products.category_id + created_at
+    op.create_index(
+        "ix_products_cat_created",
+        "products",
+        ["category_id", "created_at"],
+    )
+
+    # Create index on products.category_id + price
+    op.create_index(
+        "ix_products_cat_price",
+        "products",
+        ["category_id", "price"],
+    )
+
+    # Create partial index on in-stock products
+    op.create_index(
+        "ix_products_instock",
+        "products",
+        ["category_id", "created_at"],
+        postgresql_where=sa.text("stock > 0"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade database schema - drop product listing indexes."""
+
+    # Drop indexes
+    op.drop_index("ix_products_instock", table_name="products")
+    op.drop_index("ix_products_cat_price", table_name="products")
+    op.drop_index("ix_products_cat_created", table_name="products")
@@ -0,0 +1,99 @@
+"""Native UUID columns for catalog tables
+
+Revision ID: 004
+Revises: 003
+Create Date: 2026-10-15
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "004"
+down_revision: Union[str, None] = "003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (table, column) pairs holding catalog UUIDs, referenced columns first
+UUID_COLUMNS = (
+    ("categories", "id"),
+    ("categories", "parent_id"),
+    ("products", "id"),
+    ("products", "category_id"),
+)
+
+
+def upgrade() -> None:
+    """Upgrade database schema - store catalog ids as native uuid."""
+
+    # Foreign keys must go while referencing and referenced types differ
+    op.drop_constraint("products_category_id_fkey", "products", type_="foreignkey")
+    op.drop_constraint("categories_parent_id_fkey", "categories", type_="foreignkey")
+
+    # Convert String(36) columns to 16-byte uuid
+    for table, column in UUID_COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            type_=sa.Uuid(),
+            existing_type=sa.String(36),
+            postgresql_using=f"{column}::uuid",
+        )
+
+    # Recreate foreign keys
+    op.create_foreign_key(
+        "categories_parent_id_fkey",
+        "categories",
+        "categories",
+        ["parent_id"],
+        ["id"],
+        ondelete="CASCADE",
+    )
+    op.create_foreign_key(
+        "products_category_id_fkey",
+        "products",
+        "categories",
+        ["category_id"],
+        ["id"],
+        ondelete="SET NULL",
+    )
+
+
+def downgrade() -> None:
+    """Downgrade database schema - store catalog ids as strings."""
+
+    # Drop foreign keys
+    op.drop_constraint("products_category_id_fkey", "products", type_="foreignkey")
+    op.drop_constraint("categories_parent_id_fkey", "categories", type_="foreignkey")
+
+    # Convert uuid columns back to String(36)
+    for table, column in UUID_COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            type_=sa.String(36),
+            existing_type=sa.Uuid(),
+            postgresql_using=f"{column}::text",
+        )
+
+    # Recreate foreign keys
+    op.create_foreign_key(
+        "categories_parent_id_fkey",
+        "categories",
+        "categories",
+        ["parent_id"],
+        ["id"],
+        ondelete="CASCADE",
+    )
+    op.create_foreign_key(
+        "products_category_id_fkey",
+        "products",
+        "categories",
+        ["category_id"],
+        ["id"],
+        ondelete="SET NULL",
+    )
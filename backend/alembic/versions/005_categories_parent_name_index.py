@@ -0,0 +1,45 @@
+"""Composite index for category children
+
+Revision ID: 005
+Revises: 004
+Create Date: 2026-10-15
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "005"
+down_revision: Union[str, None] = "004"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade database schema - index category children by name."""
+
+    # Create index on categories.parent_id + name
+    op.create_index(
+        "ix_categories_parent_name",
+        "categories",
+        ["parent_id", "name"],
+    )
+
+    # Leading parent_id column makes the single-column index redundant
+    op.drop_index("ix_categories_parent_id", table_name="categories")
+
+
+def downgrade() -> None:
+    """Downgrade database schema - restore single-column parent index."""
+
+    # Create index on categories.parent_id
+    op.create_index(
+        "ix_categories_parent_id",
+        "categories",
+        ["parent_id"],
+    )
+
+    # Drop indexes
+    op.drop_index("ix_categories_parent_name", table_name="categories")
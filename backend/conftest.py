@@ -4,30 +4,17 @@ Shared pytest fixtures for all backend tests.
 Provides common fixtures for async database testing.
 """
 
-import asyncio
-from typing import AsyncGenerator, Generator
+from typing import AsyncGenerator
 
 import pytest
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession, AsyncEngine, create_async_engine
-from sqlalchemy.orm import sessionmaker
 
 
 # Test database URL (SQLite for tests)
 TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
 
 
-# ============================================================================
-# Event Loop Fixture
-# ============================================================================
-
-@pytest.fixture(scope="session")
-def event_loop() -> Generator:
-    """Create event loop for async tests."""
-    loop = asyncio.get_event_loop_policy().new_event_loop()
-    yield loop
-    loop.close()
-
-
 # ============================================================================
 # Database Engine Fixtures
 # ============================================================================
@@ -37,16 +24,24 @@ async def async_engine() -> AsyncGenerator[AsyncEngine, None]:
     """
     Create async engine for testing.
 
-    Creates all tables before tests and drops them after.
+    Creates all tables once per session; tests isolate their changes
+    with savepoints (see db_session).
     """
-    from sqlalchemy.ext.asyncio import create_async_engine
-
     engine = create_async_engine(
         TEST_DATABASE_URL,
         echo=False,
         future=True,
     )
 
+    # pysqlite defers BEGIN and breaks SAVEPOINT; issue BEGIN ourselves
+    @event.listens_for(engine.sync_engine, "connect")
+    def _disable_driver_transactions(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine.sync_engine, "begin")
+    def _emit_begin(connection):
+        connection.exec_driver_sql("BEGIN")
+
     # Create tables
     from modules.cart.infrastructure.orm import Base as CartBase
     from modules.catalog.infrastructure.orm import Base as CatalogBase
@@ -70,17 +65,22 @@ async def db_session(async_engine: AsyncEngine) -> AsyncGenerator[AsyncSession,
     """
     Create async database session for testing.
 
-    Each test gets a fresh session that's rolled back after the test.
+    The session is bound to an outer transaction that is rolled back
+    after the test. Commits made by code under test only release a
+    savepoint, so no data leaks between tests.
     """
-    async_session_maker = sessionmaker(
-        async_engine,
-        class_=AsyncSession,
-        expire_on_commit=False,
-    )
-
-    async with async_session_maker() as session:
-        yield session
-        await session.rollback()
+    async with async_engine.connect() as connection:
+        transaction = await connection.begin()
+        session = AsyncSession(
+            bind=connection,
+            expire_on_commit=False,
+            join_transaction_mode="create_savepoint",
+        )
+        try:
+            yield session
+        finally:
+            await session.close()
+            await transaction.rollback()
 
 
 @pytest.fixture
@@ -8,6 +8,7 @@ from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 
 from .config import get_settings
 from .database import db_manager
@@ -60,6 +61,8 @@ def create_app() -> FastAPI:
         redoc_url="/redoc",
         openapi_url="/openapi.json",
         lifespan=lifespan,
+        # Render response bodies with orjson instead of stdlib json
+        default_response_class=ORJSONResponse,
     )
 
     # Setup middleware
@@ -33,6 +33,8 @@ class Settings(BaseSettings):
     DB_PASSWORD: str = ""  # MUST be set via environment variable
     DB_HOST: str = "localhost"
     DB_PORT: int = 5432
+    # Per-connection LRU of asyncpg prepared statements (0 disables)
+    DB_PREPARED_STATEMENT_CACHE_SIZE: int = 1024
 
     @property
     def DATABASE_URL(self) -> str:
@@ -4,7 +4,8 @@ Database configuration and session management.
 Provides async engine, session factory, and database utilities.
 """
 
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, AsyncIterator
+from contextlib import asynccontextmanager
 from typing import Optional
 
 import asyncpg
@@ -49,6 +50,13 @@ class DatabaseManager:
                 pool_pre_ping=True,
                 pool_size=10,
                 max_overflow=20,
+                # Hot lookups (e.g. get_by_id) reuse server-side prepared
+                # statements instead of being parsed on every call
+                connect_args={
+                    "prepared_statement_cache_size": (
+                        settings.DB_PREPARED_STATEMENT_CACHE_SIZE
+                    ),
+                },
             )
         return self._engine
 
@@ -65,15 +73,18 @@ class DatabaseManager:
             )
         return self._session_maker
 
-    async def get_session(self) -> AsyncGenerator[AsyncSession, None]:
+    @asynccontextmanager
+    async def session(self) -> AsyncIterator[AsyncSession]:
         """
-        Get async database session.
+        Open a database session scoped to an ``async with`` block.
+
+        Commits on normal exit and rolls back if the block raises.
 
         Yields:
             AsyncSession: Database session
 
         Example:
-            async with db_manager.get_session() as session:
+            async with db_manager.session() as session:
                 await session.execute(query)
         """
         async with self.session_maker() as session:
@@ -86,6 +97,18 @@ class DatabaseManager:
             finally:
                 await session.close()
 
+    async def get_session(self) -> AsyncGenerator[AsyncSession, None]:
+        """
+        Get async database session.
+
+        Generator form of session() for dependency injection.
+
+        Yields:
+            AsyncSession: Database session
+        """
+        async with self.session() as session:
+            yield session
+
     async def create_database(self) -> None:
         """
         Create database if it doesn't exist.
@@ -93,23 +116,10 @@ class DatabaseManager:
         Raises:
             asyncpg.PostgresError: If database creation fails
         """
-        conn = await asyncpg.connect(
-            host=settings.DB_HOST,
-            port=settings.DB_PORT,
-            user=settings.DB_USER,
-            password=settings.DB_PASSWORD,
-            database="postgres",  # Connect to default database
-        )
+        conn = await self._connect_admin()
 
         try:
-            # Check if database exists
-            exists = await conn.fetchval(
-                "SELECT EXISTS(SELECT 1 FROM pg_database WHERE datname = $1)",
-                settings.DB_NAME,
-            )
-
-            if not exists:
-                await conn.execute(f'CREATE DATABASE "{settings.DB_NAME}"')
+            await self._create_database(conn)
         finally:
             await conn.close()
 
@@ -122,29 +132,67 @@ class DatabaseManager:
         Raises:
             asyncpg.PostgresError: If database drop fails
         """
-        conn = await asyncpg.connect(
+        conn = await self._connect_admin()
+
+        try:
+            await self._drop_database(conn)
+        finally:
+            await conn.close()
+
+    async def recreate_database(self) -> None:
+        """
+        Drop and create database over a single admin connection.
+
+        WARNING: This will delete all data!
+
+        Raises:
+            asyncpg.PostgresError: If database drop or creation fails
+        """
+        conn = await self._connect_admin()
+
+        try:
+            await self._drop_database(conn)
+            await self._create_database(conn)
+        finally:
+            await conn.close()
+
+    async def _connect_admin(self) -> asyncpg.Connection:
+        """Connect to the default maintenance database."""
+        return await asyncpg.connect(
             host=settings.DB_HOST,
             port=settings.DB_PORT,
             user=settings.DB_USER,
             password=settings.DB_PASSWORD,
-            database="postgres",
+            database="postgres",  # Connect to default database
         )
 
-        try:
-            # Terminate all connections to the database
-            await conn.execute(
-                f"""
-                SELECT pg_terminate_backend(pid)
-                FROM pg_stat_activity
-                WHERE datname = '{settings.DB_NAME}'
-                AND pid <> pg_backend_pid()
-            """
-            )
+    @staticmethod
+    async def _create_database(conn: asyncpg.Connection) -> None:
+        """Create application database on an admin connection if missing."""
+        # Check if database exists
+        exists = await conn.fetchval(
+            "SELECT EXISTS(SELECT 1 FROM pg_database WHERE datname = $1)",
+            settings.DB_NAME,
+        )
 
-            # Drop database
-            await conn.execute(f'DROP DATABASE IF EXISTS "{settings.DB_NAME}"')
-        finally:
-            await conn.close()
+        if not exists:
+            await conn.execute(f'CREATE DATABASE "{settings.DB_NAME}"')
+
+    @staticmethod
+    async def _drop_database(conn: asyncpg.Connection) -> None:
+        """Drop application database on an admin connection if present."""
+        # Terminate all connections to the database
+        await conn.execute(
+            f"""
+            SELECT pg_terminate_backend(pid)
+            FROM pg_stat_activity
+            WHERE datname = '{settings.DB_NAME}'
+            AND pid <> pg_backend_pid()
+        """
+        )
+
+        # Drop database
+        await conn.execute(f'DROP DATABASE IF EXISTS "{settings.DB_NAME}"')
 
     async def init_models(self) -> None:
         """Create all tables (use only for development/testing)."""
@@ -174,5 +222,5 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
             result = await db.execute(select(Product))
             return result.scalars().all()
     """
-    async for session in db_manager.get_session():
+    async with db_manager.session() as session:
         yield session
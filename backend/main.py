@@ -22,11 +22,8 @@ async def init_database() -> None:
 
     This will DELETE all existing data!
     """
-    print("🗑️  Dropping database if exists...")
-    await db_manager.drop_database()
-
-    print("📦 Creating new database...")
-    await db_manager.create_database()
+    print("🗑️  Dropping and recreating database...")
+    await db_manager.recreate_database()
 
     print("📋 Running migrations...")
     # Run alembic migrations
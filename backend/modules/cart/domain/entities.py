@@ -201,7 +201,7 @@ class Cart:
                 cart_id=self.id if self.id else uuid4(),
                 product_id=product_id,
                 quantity=quantity,
-                price_at_add=int(price.amount * 100),  # Convert to cents
+                price_at_add=price.cents,
                 currency=price.currency,
             )
             self.items.append(item)
@@ -3,11 +3,12 @@ Pytest configuration and fixtures for Cart module tests.
 """
 
 import pytest
+from types import SimpleNamespace
 from uuid import UUID, uuid4
-from unittest.mock import AsyncMock, Mock
+from unittest.mock import Mock
 
+from modules.cart.application.services import CartService
 from modules.cart.domain.entities import Cart, CartItem
-from modules.cart.domain.repositories import ICartRepository
 from modules.cart.domain.value_objects import Quantity, SessionId
 from modules.catalog.domain.entities import Product
 from modules.catalog.domain.value_objects import Price
@@ -21,6 +22,7 @@ from modules.cart.tests.fixtures import (
     create_cart_with_items,
     create_test_cart_item,
 )
+from tests_support.fakes import make_fake_product_repo, make_fake_repo
 
 
 # ============================================================================
@@ -113,34 +115,17 @@ def sample_cart_item(cart_id: UUID, product_id: UUID, test_price: Price) -> Cart
 # ============================================================================
 
 @pytest.fixture
-def mock_cart_repository():
+def mock_cart_repository() -> SimpleNamespace:
     """Create mock cart repository."""
-    mock = Mock(spec=ICartRepository)
-
-    # Configure async methods
-    mock.get_by_session_id = AsyncMock()
-    mock.save = AsyncMock()
-    mock.delete = AsyncMock()
-    mock.get_item_by_id = AsyncMock()
-    mock.delete_item = AsyncMock()
-
-    return mock
+    return make_fake_repo(
+        "get_by_session_id", "save", "delete", "get_item_by_id", "delete_item"
+    )
 
 
 @pytest.fixture
-def mock_product_repository():
+def mock_product_repository() -> SimpleNamespace:
     """Create mock product repository."""
-    from modules.catalog.domain.repositories import IProductRepository
-
-    mock = Mock(spec=IProductRepository)
-
-    # Configure async methods
-    mock.get_by_id = AsyncMock()
-    mock.get_all = AsyncMock()
-    mock.search = AsyncMock()
-    mock.count = AsyncMock()
-
-    return mock
+    return make_fake_product_repo()
 
 
 @pytest.fixture
@@ -158,3 +143,13 @@ def mock_product(product_id: UUID, test_price: Price) -> Product:
     product.is_available = Mock(return_value=True)
 
     return product
+
+
+# ============================================================================
+# Service Fixtures
+# ============================================================================
+
+@pytest.fixture
+def cart_service(mock_cart_repository, mock_product_repository) -> CartService:
+    """Create cart service wired to mock repositories."""
+    return CartService(mock_cart_repository, mock_product_repository)
@@ -115,20 +115,21 @@ INVALID_QUANTITIES = [0, -1, 101, 1000]
 INVALID_PRICES = [0, -1.99, -100]
 INVALID_CURRENCIES = ["", "US", "USDOLLAR", "AB", "XX"]
 
+# Fixed IDs: deterministic and free of work at import time
 CART_TEST_DATA = {
     "empty_cart": {"session_id": "test-session-1"},
     "cart_with_one_item": {
         "session_id": "test-session-2",
-        "product_id": uuid4(),
+        "product_id": UUID(int=1),
         "quantity": 2,
         "price": 19.99,
     },
     "cart_with_multiple_items": {
         "session_id": "test-session-3",
         "items": [
-            {"product_id": uuid4(), "quantity": 1, "price": 10.0},
-            {"product_id": uuid4(), "quantity": 3, "price": 20.0},
-            {"product_id": uuid4(), "quantity": 2, "price": 15.0},
+            {"product_id": UUID(int=2), "quantity": 1, "price": 10.0},
+            {"product_id": UUID(int=3), "quantity": 3, "price": 20.0},
+            {"product_id": UUID(int=4), "quantity": 2, "price": 15.0},
         ],
     },
 }
@@ -146,14 +147,14 @@ MERGE_TEST_DATA = {
     "source_cart": {
         "session_id": "source-session",
         "items": [
-            {"product_id": uuid4(), "quantity": 2, "price": 10.0},
-            {"product_id": uuid4(), "quantity": 3, "price": 20.0},
+            {"product_id": UUID(int=5), "quantity": 2, "price": 10.0},
+            {"product_id": UUID(int=6), "quantity": 3, "price": 20.0},
         ],
     },
     "target_cart": {
         "session_id": "target-session",
         "items": [
-            {"product_id": uuid4(), "quantity": 1, "price": 15.0},
+            {"product_id": UUID(int=7), "quantity": 1, "price": 15.0},
         ],
     },
 }
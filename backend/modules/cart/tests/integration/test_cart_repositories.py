@@ -10,7 +10,6 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from modules.cart.domain.entities import Cart, CartItem
 from modules.cart.infrastructure.repositories import SQLAlchemyCartRepository
-from modules.cart.infrastructure.orm import Base as CartBase
 from modules.catalog.domain.value_objects import Price
 
 
@@ -21,12 +20,6 @@ from modules.catalog.domain.value_objects import Price
 class TestSQLAlchemyCartRepository:
     """Test suite for SQLAlchemyCartRepository with database."""
 
-    @pytest.fixture(autouse=True)
-    async def setup_tables(self, async_engine):
-        """Setup database tables before each test."""
-        async with async_engine.begin() as conn:
-            await conn.run_sync(lambda _: CartBase.metadata.create_all(_))
-
     @pytest.fixture
     def repository(self, db_session: AsyncSession) -> SQLAlchemyCartRepository:
         """Create repository instance."""
@@ -36,7 +29,6 @@ class TestSQLAlchemyCartRepository:
     # Create and Save Tests
     # ========================================================================
 
-    @pytest.mark.asyncio
     async def test_save_new_cart(self, repository):
         """Test saving new cart to database."""
         session_id = str(uuid4())
@@ -48,7 +40,6 @@ class TestSQLAlchemyCartRepository:
         assert saved_cart.session_id == session_id
         assert len(saved_cart.items) == 0
 
-    @pytest.mark.asyncio
     async def test_save_cart_with_items(self, repository):
         """Test saving cart with items to database."""
         session_id = str(uuid4())
@@ -66,7 +57,6 @@ class TestSQLAlchemyCartRepository:
         assert saved_cart.item_count == 2
         assert float(saved_cart.total) == 59.98
 
-    @pytest.mark.asyncio
     async def test_save_cart_updates_existing(self, repository):
         """Test saving updates existing cart."""
         session_id = str(uuid4())
@@ -86,7 +76,6 @@ class TestSQLAlchemyCartRepository:
         assert len(updated_cart.items) == 1
         assert updated_cart.item_count == 3
 
-    @pytest.mark.asyncio
     async def test_get_by_session_id(self, repository):
         """Test retrieving cart by session ID."""
         session_id = str(uuid4())
@@ -102,14 +91,12 @@ class TestSQLAlchemyCartRepository:
         assert retrieved_cart.id == saved_cart.id
         assert retrieved_cart.session_id == session_id
 
-    @pytest.mark.asyncio
     async def test_get_by_session_id_not_found(self, repository):
         """Test retrieving non-existent cart returns None."""
         retrieved_cart = await repository.get_by_session_id(str(uuid4()))
 
         assert retrieved_cart is None
 
-    @pytest.mark.asyncio
     async def test_get_cart_with_items_by_session_id(self, repository):
         """Test retrieving cart with items by session ID."""
         session_id = str(uuid4())
@@ -130,7 +117,6 @@ class TestSQLAlchemyCartRepository:
         assert retrieved_cart.items[0].quantity == 2
         assert float(retrieved_cart.items[0].subtotal) == 39.98
 
-    @pytest.mark.asyncio
     async def test_delete_cart(self, repository):
         """Test deleting cart from database."""
         session_id = str(uuid4())
@@ -146,7 +132,6 @@ class TestSQLAlchemyCartRepository:
         retrieved_cart = await repository.get_by_session_id(session_id)
         assert retrieved_cart is None
 
-    @pytest.mark.asyncio
     async def test_get_item_by_id(self, repository):
         """Test retrieving cart item by ID."""
         session_id = str(uuid4())
@@ -166,14 +151,12 @@ class TestSQLAlchemyCartRepository:
         assert retrieved_item.id == item_id
         assert retrieved_item.quantity == 5
 
-    @pytest.mark.asyncio
     async def test_get_item_by_id_not_found(self, repository):
         """Test retrieving non-existent item returns None."""
         retrieved_item = await repository.get_item_by_id(uuid4())
 
         assert retrieved_item is None
 
-    @pytest.mark.asyncio
     async def test_delete_item(self, repository):
         """Test deleting cart item from database."""
         session_id = str(uuid4())
@@ -193,7 +176,6 @@ class TestSQLAlchemyCartRepository:
         retrieved_cart = await repository.get_by_session_id(session_id)
         assert len(retrieved_cart.items) == 0
 
-    @pytest.mark.asyncio
     async def test_update_cart_replaces_all_items(self, repository):
         """Test that updating cart replaces all items correctly."""
         session_id = str(uuid4())
@@ -217,7 +199,6 @@ class TestSQLAlchemyCartRepository:
         assert retrieved_cart.items[0].product_id == product_id2
         assert retrieved_cart.items[0].quantity == 3
 
-    @pytest.mark.asyncio
     async def test_multiple_carts_same_session(self, repository):
         """Test handling multiple carts with different sessions."""
         session_id1 = str(uuid4())
@@ -243,7 +224,6 @@ class TestSQLAlchemyCartRepository:
         assert retrieved_cart2.item_count == 3
         assert retrieved_cart1.id != retrieved_cart2.id
 
-    @pytest.mark.asyncio
     async def test_cart_persistence_across_sessions(self, repository):
         """Test cart data persists across repository sessions."""
         session_id = str(uuid4())
@@ -9,6 +9,8 @@ from uuid import uuid4
 
 from modules.cart.domain.value_objects import SessionId, Quantity
 
+pytestmark = [pytest.mark.fast, pytest.mark.xdist_group("fast")]
+
 
 # ============================================================================
 # SessionId Value Object Tests
@@ -5,11 +5,11 @@ Used to transfer data between layers.
 """
 
 from dataclasses import dataclass
-from typing import Optional
+from typing import ClassVar, Optional
 from uuid import UUID
 
 
-@dataclass
+@dataclass(slots=True)
 class ProductDTO:
     """
     Product data transfer object.
@@ -18,42 +18,49 @@ class ProductDTO:
         id: Product identifier
         name: Product name
         description: Product description
-        price: Product price amount
+        price_cents: Product price in minor units (cents)
         currency: Price currency
         category_id: Category identifier
         stock: Available stock
         is_available: Availability status
     """
 
-    id: str
+    id: UUID
     name: str
     description: str
-    price: float
+    price_cents: int
     currency: str
-    category_id: Optional[str]
+    category_id: Optional[UUID]
     stock: int
     is_available: bool
 
+    @property
+    def price(self) -> float:
+        """Product price amount in major units."""
+        return self.price_cents / 100
 
-@dataclass
+
+@dataclass(slots=True)
 class ProductListDTO:
     """
     Product list data transfer object.
 
     Attributes:
         items: List of products
-        total: Total number of products
+        total: Total number of products (None for cursor pages)
         limit: Page size
         offset: Page offset
+        next_cursor: Cursor for the next page (None on the last page)
     """
 
     items: list[ProductDTO]
-    total: int
+    total: Optional[int]
     limit: int
     offset: int
+    next_cursor: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class CategoryDTO:
     """
     Category data transfer object.
@@ -64,12 +71,12 @@ class CategoryDTO:
         parent_id: Parent category identifier
     """
 
-    id: str
+    id: UUID
     name: str
-    parent_id: Optional[str]
+    parent_id: Optional[UUID]
 
 
-@dataclass
+@dataclass(slots=True)
 class CategoryTreeDTO:
     """
     Category tree node data transfer object.
@@ -81,13 +88,13 @@ class CategoryTreeDTO:
         children: Child categories
     """
 
-    id: str
+    id: UUID
     name: str
-    parent_id: Optional[str]
+    parent_id: Optional[UUID]
     children: list["CategoryTreeDTO"]
 
 
-@dataclass
+@dataclass(slots=True)
 class ProductFilterDTO:
     """
     Product filter parameters.
@@ -102,6 +109,7 @@ class ProductFilterDTO:
         order_dir: Sort direction (asc, desc)
         limit: Maximum results
         offset: Results offset
+        cursor: Keyset cursor from a previous page (replaces offset)
     """
 
     category_id: Optional[UUID] = None
@@ -113,6 +121,10 @@ class ProductFilterDTO:
     order_dir: str = "desc"
     limit: int = 100
     offset: int = 0
+    cursor: Optional[str] = None
+
+    VALID_ORDER_FIELDS: ClassVar[frozenset[str]] = frozenset({"name", "price", "created_at"})
+    VALID_ORDER_DIRS: ClassVar[frozenset[str]] = frozenset({"asc", "desc"})
 
     def __post_init__(self) -> None:
         """Validate filter parameters."""
@@ -120,16 +132,15 @@ class ProductFilterDTO:
             self.limit = 100
         if self.limit > 1000:
             self.limit = 1000
-        if self.offset < 0:
+        if self.offset < 0 or self.cursor:
             self.offset = 0
 
         # Validate order_by
-        valid_fields = {"name", "price", "created_at"}
-        if self.order_by not in valid_fields:
+        if self.order_by not in self.VALID_ORDER_FIELDS:
             self.order_by = "created_at"
 
         # Validate order_dir
-        if self.order_dir not in {"asc", "desc"}:
+        if self.order_dir not in self.VALID_ORDER_DIRS:
             self.order_dir = "desc"
 
         # Validate price range
@@ -5,7 +5,11 @@ Contains use cases for catalog operations.
 Follows Single Responsibility Principle (SRP).
 """
 
-from typing import Optional
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, Optional
 from uuid import UUID
 
 from modules.catalog.application.dto import (
@@ -16,9 +20,16 @@ from modules.catalog.application.dto import (
     ProductListDTO,
 )
 from modules.catalog.domain.entities import Category, Product
-from modules.catalog.domain.exceptions import CategoryNotFoundException, ProductNotFoundException
+from modules.catalog.domain.exceptions import (
+    CategoryNotFoundException,
+    InvalidCursorError,
+    ProductNotFoundException,
+)
 from modules.catalog.domain.repositories import ICategoryRepository, IProductRepository
 
+if TYPE_CHECKING:
+    from modules.catalog.infrastructure.cache import CategoryTreeCache, TTLCache
+
 
 class ProductService:
     """
@@ -27,14 +38,20 @@ class ProductService:
     Handles product-related use cases.
     """
 
-    def __init__(self, product_repository: IProductRepository) -> None:
+    def __init__(
+        self,
+        product_repository: IProductRepository,
+        product_cache: Optional["TTLCache"] = None,
+    ) -> None:
         """
         Initialize product service.
 
         Args:
             product_repository: Product repository instance
+            product_cache: Optional shared cache for single-product reads
         """
         self._product_repository = product_repository
+        self._product_cache = product_cache
 
     async def get_product(self, product_id: UUID) -> ProductDTO:
         """
@@ -49,12 +66,21 @@ class ProductService:
         Raises:
             ProductNotFoundException: If product not found
         """
+        if self._product_cache is not None:
+            cached = self._product_cache.get(product_id)
+            if cached is not None:
+                return cached
+
         product = await self._product_repository.get_by_id(product_id)
 
         if product is None:
             raise ProductNotFoundException(str(product_id))
 
-        return self._to_dto(product)
+        product_dto = _product_to_dto(product)
+        if self._product_cache is not None:
+            self._product_cache.set(product_id, product_dto)
+
+        return product_dto
 
     async def list_products(
         self, filters: ProductFilterDTO
@@ -67,32 +93,56 @@ class ProductService:
 
         Returns:
             ProductListDTO with products and metadata
+
+        Raises:
+            InvalidCursorError: If the cursor is malformed or stale
         """
-        products = await self._product_repository.get_all(
-            limit=filters.limit,
-            offset=filters.offset,
-            category_id=filters.category_id,
-            search_query=filters.search_query,
-            price_min=filters.price_min,
-            price_max=filters.price_max,
-            in_stock=filters.in_stock,
-            order_by=filters.order_by,
-            order_dir=filters.order_dir,
+        after = (
+            _decode_cursor(filters.cursor, filters.order_by, filters.order_dir)
+            if filters.cursor
+            else None
         )
 
-        total = await self._product_repository.count(
-            category_id=filters.category_id,
-            search_query=filters.search_query,
-            price_min=filters.price_min,
-            price_max=filters.price_max,
-            in_stock=filters.in_stock,
+        total: Optional[int]
+        if after is None:
+            products, total = await self._product_repository.list_with_count(
+                limit=filters.limit,
+                offset=filters.offset,
+                category_id=filters.category_id,
+                search_query=filters.search_query,
+                price_min=filters.price_min,
+                price_max=filters.price_max,
+                in_stock=filters.in_stock,
+                order_by=filters.order_by,
+                order_dir=filters.order_dir,
+            )
+        else:
+            # Cursor pages skip the count; clients only need the next page
+            products = await self._product_repository.get_all(
+                limit=filters.limit,
+                category_id=filters.category_id,
+                search_query=filters.search_query,
+                price_min=filters.price_min,
+                price_max=filters.price_max,
+                in_stock=filters.in_stock,
+                order_by=filters.order_by,
+                order_dir=filters.order_dir,
+                after=after,
+            )
+            total = None
+
+        next_cursor = (
+            _encode_cursor(products[-1], filters.order_by, filters.order_dir)
+            if len(products) == filters.limit
+            else None
         )
 
         return ProductListDTO(
-            items=[self._to_dto(p) for p in products],
+            items=list(map(_product_to_dto, products)),
             total=total,
             limit=filters.limit,
             offset=filters.offset,
+            next_cursor=next_cursor,
         )
 
     async def search_products(
@@ -121,28 +171,7 @@ class ProductService:
             offset=offset,
         )
 
-        return [self._to_dto(p) for p in products]
-
-    def _to_dto(self, product: Product) -> ProductDTO:
-        """
-        Convert Product entity to DTO.
-
-        Args:
-            product: Product entity
-
-        Returns:
-            ProductDTO
-        """
-        return ProductDTO(
-            id=str(product.id) if product.id else "",
-            name=product.name,
-            description=product.description,
-            price=float(product.price.amount),
-            currency=product.price.currency,
-            category_id=str(product.category_id) if product.category_id else None,
-            stock=product.stock,
-            is_available=product.is_available(),
-        )
+        return list(map(_product_to_dto, products))
 
 
 class CategoryService:
@@ -152,14 +181,23 @@ class CategoryService:
     Handles category-related use cases.
     """
 
-    def __init__(self, category_repository: ICategoryRepository) -> None:
+    def __init__(
+        self,
+        category_repository: ICategoryRepository,
+        tree_cache: Optional["CategoryTreeCache"] = None,
+        category_cache: Optional["TTLCache"] = None,
+    ) -> None:
         """
         Initialize category service.
 
         Args:
             category_repository: Category repository instance
+            tree_cache: Optional shared cache for the category tree
+            category_cache: Optional shared cache for single-category reads
         """
         self._category_repository = category_repository
+        self._tree_cache = tree_cache
+        self._category_cache = category_cache
 
     async def get_category(self, category_id: UUID) -> CategoryDTO:
         """
@@ -174,12 +212,21 @@ class CategoryService:
         Raises:
             CategoryNotFoundException: If category not found
         """
+        if self._category_cache is not None:
+            cached = self._category_cache.get(category_id)
+            if cached is not None:
+                return cached
+
         category = await self._category_repository.get_by_id(category_id)
 
         if category is None:
             raise CategoryNotFoundException(str(category_id))
 
-        return self._to_dto(category)
+        category_dto = _category_to_dto(category)
+        if self._category_cache is not None:
+            self._category_cache.set(category_id, category_dto)
+
+        return category_dto
 
     async def list_categories(
         self,
@@ -201,7 +248,7 @@ class CategoryService:
             offset=offset,
         )
 
-        return [self._to_dto(c) for c in categories]
+        return list(map(_category_to_dto, categories))
 
     async def get_category_tree(self) -> list[CategoryTreeDTO]:
         """
@@ -210,39 +257,163 @@ class CategoryService:
         Returns:
             List of root CategoryTreeDTO with children
         """
-        categories = await self._category_repository.get_tree()
+        if self._tree_cache is None:
+            categories = await self._category_repository.get_tree()
+            return _categories_to_tree_dtos(categories)
 
-        return [self._to_tree_dto(c) for c in categories]
+        version = await self._category_repository.get_tree_version()
+        tree = self._tree_cache.get(version)
+        if tree is None:
+            categories = await self._category_repository.get_tree()
+            tree = _categories_to_tree_dtos(categories)
+            self._tree_cache.set(version, tree)
 
-    def _to_dto(self, category: Category) -> CategoryDTO:
-        """
-        Convert Category entity to DTO.
+        return tree
 
-        Args:
-            category: Category entity
 
-        Returns:
-            CategoryDTO
-        """
-        return CategoryDTO(
-            id=str(category.id) if category.id else "",
-            name=category.name,
-            parent_id=str(category.parent_id) if category.parent_id else None,
-        )
+# =============================================================================
+# Helper functions
+# =============================================================================
 
-    def _to_tree_dto(self, category: Category) -> CategoryTreeDTO:
-        """
-        Convert Category entity to tree DTO.
 
-        Args:
-            category: Category entity
+def _product_to_dto(product: Product) -> ProductDTO:
+    """
+    Convert Product entity to DTO.
 
-        Returns:
-            CategoryTreeDTO with children
-        """
-        return CategoryTreeDTO(
-            id=str(category.id) if category.id else "",
-            name=category.name,
-            parent_id=str(category.parent_id) if category.parent_id else None,
-            children=[self._to_tree_dto(child) for child in category.children],
+    Args:
+        product: Product entity
+
+    Returns:
+        ProductDTO
+    """
+    price = product.price
+    return ProductDTO(
+        id=product.id,
+        name=product.name,
+        description=product.description,
+        price_cents=price.cents,
+        currency=price.currency,
+        category_id=product.category_id,
+        stock=product.stock,
+        is_available=product.is_available(),
+    )
+
+
+def _encode_cursor(product: Product, order_by: str, order_dir: str) -> str:
+    """
+    Encode the sort key of a product as an opaque page cursor.
+
+    Args:
+        product: Last product of the page
+        order_by: Sort field
+        order_dir: Sort direction
+
+    Returns:
+        URL-safe cursor string
+    """
+    if order_by == "name":
+        value: Any = product.name
+    elif order_by == "price":
+        value = product.price.cents
+    else:  # created_at
+        value = product.created_at.isoformat()
+
+    payload = json.dumps([order_by, order_dir, value, product.id_str])
+    return base64.urlsafe_b64encode(payload.encode()).decode()
+
+
+def _decode_cursor(cursor: str, order_by: str, order_dir: str) -> tuple[Any, UUID]:
+    """
+    Decode a page cursor into a repository keyset.
+
+    Args:
+        cursor: Cursor produced by _encode_cursor
+        order_by: Sort field of the current request
+        order_dir: Sort direction of the current request
+
+    Returns:
+        Tuple of (sort value, product ID)
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed or was issued for
+            a different ordering
+    """
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor))
+    except (ValueError, binascii.Error):
+        raise InvalidCursorError() from None
+
+    if type(payload) is not list or len(payload) != 4:
+        raise InvalidCursorError()
+    cursor_order_by, cursor_order_dir, value, product_id = payload
+    if (cursor_order_by, cursor_order_dir) != (order_by, order_dir):
+        raise InvalidCursorError()
+    if not isinstance(product_id, str):
+        raise InvalidCursorError()
+
+    try:
+        if order_by == "created_at":
+            if not isinstance(value, str):
+                raise InvalidCursorError()
+            value = datetime.fromisoformat(value)
+        elif order_by == "price" and type(value) is not int:
+            raise InvalidCursorError()
+        elif order_by == "name" and not isinstance(value, str):
+            raise InvalidCursorError()
+        return value, UUID(product_id)
+    except ValueError:
+        raise InvalidCursorError() from None
+
+
+def _category_to_dto(category: Category) -> CategoryDTO:
+    """
+    Convert Category entity to DTO.
+
+    Args:
+        category: Category entity
+
+    Returns:
+        CategoryDTO
+    """
+    return CategoryDTO(
+        id=category.id,
+        name=category.name,
+        parent_id=category.parent_id,
+    )
+
+
+def _categories_to_tree_dtos(categories: list[Category]) -> list[CategoryTreeDTO]:
+    """
+    Convert Category entities to tree DTOs.
+
+    Walks the hierarchy with an explicit stack instead of recursion,
+    appending each node to its parent's children list.
+
+    Args:
+        categories: Root Category entities
+
+    Returns:
+        List of CategoryTreeDTO with children
+    """
+    roots: list[CategoryTreeDTO] = []
+    stack = [(category, roots) for category in reversed(categories)]
+
+    while stack:
+        category, siblings = stack.pop()
+        children: list[CategoryTreeDTO] = []
+        # Positional arguments: (id, name, parent_id, children)
+        siblings.append(
+            CategoryTreeDTO(
+                category.id,
+                category.name,
+                category.parent_id,
+                children,
+            )
         )
+        if category.children:
+            # Push in reverse so children are visited in their original order
+            stack.extend(
+                [(child, children) for child in reversed(category.children)]
+            )
+
+    return roots
@@ -7,12 +7,59 @@ Follows Entity pattern from DDD.
 
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Final, Optional
+from typing import Any, Final, Optional
 from uuid import UUID, uuid4
 
 from .value_objects import Price, ProductName, Quantity
 
 
+def _default_timestamps(
+    created_at: Optional[datetime], updated_at: Optional[datetime]
+) -> tuple[datetime, datetime]:
+    """
+    Fill missing entity timestamps from a single clock read.
+
+    Args:
+        created_at: Creation timestamp, if known
+        updated_at: Last update timestamp, if known
+
+    Returns:
+        Tuple of (created_at, updated_at)
+    """
+    if created_at is None or updated_at is None:
+        now = datetime.utcnow()
+        return created_at or now, updated_at or now
+    return created_at, updated_at
+
+
+class _UUIDStr:
+    """
+    Read-only string view of an optional UUID attribute.
+
+    Memoized per instance and recomputed only when the underlying
+    attribute is reassigned. Evaluates to None when the UUID is unset.
+    """
+
+    def __init__(self, attr: str) -> None:
+        """Initialize descriptor for the given UUID attribute name."""
+        self._attr = attr
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        """Remember the instance dict key holding the memo."""
+        self._memo_key = f"_{name}_memo"
+
+    def __get__(self, obj: Any, objtype: Optional[type] = None) -> Any:
+        """Return cached string form of the UUID attribute."""
+        if obj is None:
+            return self
+        value = getattr(obj, self._attr)
+        memo = obj.__dict__.get(self._memo_key)
+        if memo is None or memo[0] is not value:
+            memo = (value, str(value) if value else None)
+            obj.__dict__[self._memo_key] = memo
+        return memo[1]
+
+
 @dataclass
 class Category:
     """
@@ -33,12 +80,15 @@ class Category:
     name: str
     parent_id: Optional[UUID] = None
     children: list["Category"] = field(default_factory=list)
-    created_at: datetime = field(default_factory=datetime.utcnow)
-    updated_at: datetime = field(default_factory=datetime.utcnow)
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
 
     MIN_NAME_LENGTH: Final[int] = 1
     MAX_NAME_LENGTH: Final[int] = 100
 
+    id_str = _UUIDStr("id")
+    parent_id_str = _UUIDStr("parent_id")
+
     def __post_init__(self) -> None:
         """Validate category."""
         if not self.name or len(self.name.strip()) < self.MIN_NAME_LENGTH:
@@ -48,10 +98,64 @@ class Category:
                 f"Category name cannot exceed {self.MAX_NAME_LENGTH} characters"
             )
 
+        self.created_at, self.updated_at = _default_timestamps(
+            self.created_at, self.updated_at
+        )
+
+        # Memoized descendants and the parent link used to invalidate them.
+        # Plain instance attributes rather than dataclass fields, so asdict(),
+        # repr() and == never follow the back-reference, while copy and
+        # pickle carry them along with the rest of the tree.
+        # Children must be attached via add_child to keep the cache valid.
+        self._descendants_cache: Optional[list[Category]] = None
+        self._parent_link: Optional[Category] = None
+        for child in self.children:
+            child._parent = self
+
         # Check for circular reference
         if self._creates_circular_reference():
             raise ValueError("Circular reference detected in category hierarchy")
 
+    @classmethod
+    def from_trusted(cls, **fields: Any) -> "Category":
+        """
+        Build category from already validated data without re-validating.
+
+        Intended for repository hydration of rows that were written
+        through the domain model. Skips __post_init__ checks.
+
+        Args:
+            **fields: Category field values
+
+        Returns:
+            Category instance
+        """
+        category = object.__new__(cls)
+        category.__dict__.update({
+            "children": [],
+            "_descendants_cache": None,
+            "_parent_link": None,
+            **fields,
+        })
+        for child in category.children:
+            child._parent = category
+        return category
+
+    @property
+    def _parent(self) -> Optional["Category"]:
+        """Parent category this node is attached to, if any."""
+        return self._parent_link
+
+    @_parent.setter
+    def _parent(self, parent: Optional["Category"]) -> None:
+        """Link this node to parent, invalidating the old parent's memo."""
+        old_parent = self._parent_link
+        if old_parent is parent:
+            return
+        if old_parent is not None:
+            old_parent._invalidate_descendants()
+        self._parent_link = parent
+
     def _creates_circular_reference(self) -> bool:
         """
         Check if adding this category creates a circular reference.
@@ -68,18 +172,66 @@ class Category:
             for child in self._get_all_descendants()
         )
 
+    def _creates_cycle_with(self, child: "Category") -> bool:
+        """
+        Check if attaching child under this category would create a cycle.
+
+        Collects this category's ancestors by walking up parent links,
+        including an ancestor known only by the root's parent_id, then
+        checks whether child or any of its memoized descendants is one
+        of them, by identity or by id.
+
+        Args:
+            child: Category about to be attached
+
+        Returns:
+            True if child's subtree contains this category or an ancestor
+        """
+        ancestor_ids: set[UUID] = set()
+        node: Optional[Category] = self
+        root = self
+        while node is not None:
+            if node is child:
+                return True
+            if node.id is not None:
+                ancestor_ids.add(node.id)
+            root = node
+            node = node._parent
+        if root.parent_id is not None:
+            ancestor_ids.add(root.parent_id)
+
+        if not ancestor_ids:
+            return False
+        return child.id in ancestor_ids or any(
+            descendant.id in ancestor_ids
+            for descendant in child._get_all_descendants()
+        )
+
     def _get_all_descendants(self) -> list["Category"]:
         """
         Get all descendant categories recursively.
 
+        Result is memoized per node until the subtree changes.
+
         Returns:
             List of all descendant categories
         """
-        descendants: list[Category] = []
-        for child in self.children:
-            descendants.append(child)
-            descendants.extend(child._get_all_descendants())
-        return descendants
+        if self._descendants_cache is None:
+            descendants: list[Category] = []
+            for child in self.children:
+                descendants.append(child)
+                descendants.extend(child._get_all_descendants())
+            self._descendants_cache = descendants
+        return self._descendants_cache
+
+    def _invalidate_descendants(self) -> None:
+        """Drop memoized descendants of this category and its ancestors."""
+        # A node is only cached if all of its descendants are cached,
+        # so the walk can stop at the first uncached ancestor.
+        node: Optional[Category] = self
+        while node is not None and node._descendants_cache is not None:
+            node._descendants_cache = None
+            node = node._parent
 
     def add_child(self, child: "Category") -> None:
         """
@@ -94,23 +246,22 @@ class Category:
         if child.id == self.id:
             raise ValueError("Cannot add category as its own child")
 
-        # Temporarily add child and check for circular reference
+        if self._creates_cycle_with(child):
+            raise ValueError("Adding child creates circular reference")
+
         self.children.append(child)
         child.parent_id = self.id
-
-        if self._creates_circular_reference():
-            self.children.remove(child)
-            child.parent_id = None
-            raise ValueError("Adding child creates circular reference")
+        child._parent = self
+        self._invalidate_descendants()
 
         self.updated_at = datetime.utcnow()
 
     def to_dict(self) -> dict:
         """Convert to dictionary."""
         return {
-            "id": str(self.id) if self.id else None,
+            "id": self.id_str,
             "name": self.name,
-            "parent_id": str(self.parent_id) if self.parent_id else None,
+            "parent_id": self.parent_id_str,
             "created_at": self.created_at.isoformat(),
             "updated_at": self.updated_at.isoformat(),
         }
@@ -140,13 +291,16 @@ class Product:
     price: Price
     category_id: Optional[UUID]
     stock: int
-    created_at: datetime = field(default_factory=datetime.utcnow)
-    updated_at: datetime = field(default_factory=datetime.utcnow)
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
 
     MIN_NAME_LENGTH: Final[int] = 1
     MAX_NAME_LENGTH: Final[int] = 255
     MAX_DESCRIPTION_LENGTH: Final[int] = 5000
 
+    id_str = _UUIDStr("id")
+    category_id_str = _UUIDStr("category_id")
+
     def __post_init__(self) -> None:
         """Validate product."""
         if not self.name or len(self.name.strip()) < self.MIN_NAME_LENGTH:
@@ -162,6 +316,28 @@ class Product:
         if self.stock < 0:
             raise ValueError("Stock cannot be negative")
 
+        self.created_at, self.updated_at = _default_timestamps(
+            self.created_at, self.updated_at
+        )
+
+    @classmethod
+    def from_trusted(cls, **fields: Any) -> "Product":
+        """
+        Build product from already validated data without re-validating.
+
+        Intended for repository hydration of rows that were written
+        through the domain model. Skips __post_init__ checks.
+
+        Args:
+            **fields: Product field values
+
+        Returns:
+            Product instance
+        """
+        product = object.__new__(cls)
+        product.__dict__.update(fields)
+        return product
+
     def is_available(self, requested_quantity: int = 1) -> bool:
         """
         Check if product is available in requested quantity.
@@ -213,12 +389,12 @@ class Product:
     def to_dict(self) -> dict:
         """Convert to dictionary."""
         return {
-            "id": str(self.id) if self.id else None,
+            "id": self.id_str,
             "name": self.name,
             "description": self.description,
-            "price": float(self.price.amount),
+            "price": self.price.cents / 100,
             "currency": self.price.currency,
-            "category_id": str(self.category_id) if self.category_id else None,
+            "category_id": self.category_id_str,
             "stock": self.stock,
             "is_available": self.is_available(),
             "created_at": self.created_at.isoformat(),
@@ -4,7 +4,7 @@ Domain-specific exceptions for Catalog module.
 Custom exceptions that represent domain error conditions.
 """
 
-from core.exceptions import AppException, NotFoundException
+from core.exceptions import AppException, NotFoundException, ValidationException
 
 
 class ProductNotFoundException(NotFoundException):
@@ -68,3 +68,16 @@ class InsufficientStockError(AppException):
         self.product_id = product_id
         self.requested_quantity = requested_quantity
         self.available_stock = available_stock
+
+
+class InvalidCursorError(ValidationException):
+    """
+    Exception raised when a page cursor cannot be used.
+
+    Raised for malformed cursors and for cursors issued for a different
+    ordering, so clients never silently restart from the first page.
+    """
+
+    def __init__(self) -> None:
+        """Initialize invalid cursor error."""
+        super().__init__(message="Invalid or expired page cursor", field="cursor")
@@ -6,7 +6,8 @@ Follows Dependency Inversion Principle (DIP) - high-level modules depend on abst
 """
 
 from abc import ABC, abstractmethod
-from typing import Optional
+from collections.abc import Hashable
+from typing import Any, Optional
 from uuid import UUID
 
 from modules.catalog.domain.entities import Category, Product
@@ -44,10 +45,15 @@ class IProductRepository(ABC):
         in_stock: bool = False,
         order_by: str = "created_at",
         order_dir: str = "desc",
+        after: Optional[tuple[Any, UUID]] = None,
     ) -> list[Product]:
         """
         Get all products with optional filtering and sorting.
 
+        Results are ordered by the sort field, then by ID. When ``after``
+        is given, only products positioned after that key in this order
+        are returned (keyset pagination).
+
         Args:
             limit: Maximum number of products to return
             offset: Number of products to skip
@@ -58,12 +64,48 @@ class IProductRepository(ABC):
             in_stock: Only show in-stock items
             order_by: Sort field
             order_dir: Sort direction
+            after: (sort value, product ID) of the last product seen;
+                price values are in cents
 
         Returns:
             List of products
         """
         pass
 
+    @abstractmethod
+    async def list_with_count(
+        self,
+        limit: int = 100,
+        offset: int = 0,
+        category_id: Optional[UUID] = None,
+        search_query: Optional[str] = None,
+        price_min: Optional[float] = None,
+        price_max: Optional[float] = None,
+        in_stock: bool = False,
+        order_by: str = "created_at",
+        order_dir: str = "desc",
+    ) -> tuple[list[Product], int]:
+        """
+        Get a page of products together with the total match count.
+
+        Implementations should fetch both in a single round trip.
+
+        Args:
+            limit: Maximum number of products to return
+            offset: Number of products to skip
+            category_id: Filter by category ID
+            search_query: Search by name or description
+            price_min: Minimum price filter
+            price_max: Maximum price filter
+            in_stock: Only show in-stock items
+            order_by: Sort field
+            order_dir: Sort direction
+
+        Returns:
+            Tuple of (products, total number of matching products)
+        """
+        pass
+
     @abstractmethod
     async def search(
         self,
@@ -74,6 +116,13 @@ class IProductRepository(ABC):
         """
         Search products by name or description.
 
+        Matching is a case-insensitive substring match on name or
+        description, ordered by name. It must be evaluated by the storage
+        engine (not by filtering rows in Python) and should be backed by
+        an index that serves substring predicates, such as a PostgreSQL
+        pg_trgm GIN index. The service passes an already trimmed query of
+        at least two characters.
+
         Args:
             query: Search query string
             limit: Maximum number of products to return
@@ -157,6 +206,19 @@ class ICategoryRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    async def get_tree_version(self) -> Hashable:
+        """
+        Get a version token for the category hierarchy.
+
+        The token is opaque and compared by equality only; it must change
+        whenever a category is added, removed or updated.
+
+        Returns:
+            Version token of the current category set
+        """
+        pass
+
     @abstractmethod
     async def get_children(self, parent_id: UUID) -> list[Category]:
         """
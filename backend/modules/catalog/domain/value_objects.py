@@ -6,8 +6,12 @@ Follows Value Object pattern from DDD.
 """
 
 from dataclasses import dataclass
-from decimal import Decimal
-from typing import Final
+from decimal import ROUND_HALF_UP, Decimal
+from functools import cached_property
+from typing import Any, ClassVar, Final
+
+# Quantum for rounding amounts to whole cents
+_CENT: Final[Decimal] = Decimal("0.01")
 
 
 @dataclass(frozen=True)
@@ -28,9 +32,23 @@ class Money:
 
     def __post_init__(self) -> None:
         """Validate money value."""
-        if self.amount < 0:
+        self._validate(self.amount, self.currency)
+
+    @staticmethod
+    def _validate(amount: Any, currency: str) -> None:
+        """
+        Validate amount and currency.
+
+        Args:
+            amount: Amount (Decimal, or integer minor units)
+            currency: Currency code
+
+        Raises:
+            ValueError: If amount is negative or currency is invalid
+        """
+        if amount < 0:
             raise ValueError("Amount cannot be negative")
-        if not self.currency or len(self.currency) != 3:
+        if not currency or len(currency) != 3:
             raise ValueError("Currency must be a valid 3-letter code")
 
     def __str__(self) -> str:
@@ -44,14 +62,31 @@ class Price(Money):
     Represents a product price.
 
     Extends Money with price-specific validation.
+
+    Prices built from integer cents keep the cents and create the
+    Decimal amount only when it is first read.
     """
 
-    def __post_init__(self) -> None:
+    @staticmethod
+    def _validate(amount: Any, currency: str) -> None:
         """Validate price value."""
-        super().__post_init__()
-        if self.amount == 0:
+        Money._validate(amount, currency)
+        if amount == 0:
             raise ValueError("Price cannot be zero")
 
+    def __getattr__(self, name: str) -> Any:
+        """Materialize amount lazily for prices built from cents."""
+        if name == "amount" and "cents" in self.__dict__:
+            amount = Decimal(self.__dict__["cents"]).scaleb(-2)
+            self.__dict__["amount"] = amount
+            return amount
+        raise AttributeError(name)
+
+    @cached_property
+    def cents(self) -> int:
+        """Price in integer cents, rounding sub-cent amounts half up."""
+        return int(self.amount.quantize(_CENT, ROUND_HALF_UP) * 100)
+
     @classmethod
     def from_decimal(cls, amount: Decimal, currency: str = "USD") -> "Price":
         """
@@ -65,7 +100,7 @@ class Price(Money):
             Price instance
         """
         # Round to 2 decimal places (cents)
-        rounded_amount = amount.quantize(Decimal("0.01"))
+        rounded_amount = amount.quantize(_CENT, ROUND_HALF_UP)
         return cls(amount=rounded_amount, currency=currency)
 
     @classmethod
@@ -94,10 +129,14 @@ class Price(Money):
         Returns:
             Price instance
         """
-        return cls.from_decimal(Decimal(amount) / Decimal("100"), currency)
+        cls._validate(amount, currency)
+        price = object.__new__(cls)
+        # Decimal amount is derived from cents on first access
+        price.__dict__.update(cents=amount, currency=currency)
+        return price
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Quantity:
     """
     Represents a product quantity.
@@ -111,8 +150,8 @@ class Quantity:
 
     value: int
 
-    MIN_VALUE: Final[int] = 1
-    MAX_VALUE: Final[int] = 1000000
+    MIN_VALUE: ClassVar[int] = 1
+    MAX_VALUE: ClassVar[int] = 1000000
 
     def __post_init__(self) -> None:
         """Validate quantity value."""
@@ -139,7 +178,7 @@ class Quantity:
         return Quantity(result)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ProductName:
     """
     Represents a product name.
@@ -153,8 +192,8 @@ class ProductName:
 
     value: str
 
-    MIN_LENGTH: Final[int] = 1
-    MAX_LENGTH: Final[int] = 255
+    MIN_LENGTH: ClassVar[int] = 1
+    MAX_LENGTH: ClassVar[int] = 255
 
     def __post_init__(self) -> None:
         """Validate product name."""
@@ -170,7 +209,7 @@ class ProductName:
         return self.value.strip()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Description:
     """
     Represents a product description.
@@ -184,7 +223,7 @@ class Description:
 
     value: str
 
-    MAX_LENGTH: Final[int] = 5000
+    MAX_LENGTH: ClassVar[int] = 5000
 
     def __post_init__(self) -> None:
         """Validate description."""
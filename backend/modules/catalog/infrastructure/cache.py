@@ -0,0 +1,180 @@
+"""
+In-process caches for Catalog module.
+
+Shared read caches for catalog services, provided to routes through
+FastAPI dependencies so tests and write paths can override or clear them.
+"""
+
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from functools import lru_cache
+from typing import Any, Optional
+
+from modules.catalog.application.dto import CategoryTreeDTO
+
+
+class TTLCache:
+    """
+    Process-local LRU cache with a per-entry time-to-live.
+
+    Bounds staleness of hot read paths by ttl seconds. Meant to be shared
+    across service instances.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        ttl: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Initialize empty cache.
+
+        Args:
+            maxsize: Maximum number of entries kept
+            ttl: Entry lifetime in seconds
+            clock: Monotonic time source
+        """
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._clock = clock
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """
+        Get cached value if present and not expired.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached value, or None on miss
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if expires_at <= self._clock():
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """
+        Store value, evicting the least recently used entry when full.
+
+        Args:
+            key: Cache key
+            value: Value to cache
+        """
+        self._entries[key] = (self._clock() + self._ttl, value)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+
+    def delete(self, key: Hashable) -> None:
+        """Drop a single entry."""
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        self._entries.clear()
+
+
+class CategoryTreeCache:
+    """
+    Version-tagged cache for the category tree.
+
+    Holds the last built tree together with the repository version token
+    it was built from. Meant to be shared across CategoryService instances.
+    """
+
+    def __init__(self) -> None:
+        """Initialize empty cache."""
+        self._version: Optional[Hashable] = None
+        self._tree: Optional[list[CategoryTreeDTO]] = None
+
+    def get(self, version: Hashable) -> Optional[list[CategoryTreeDTO]]:
+        """
+        Get cached tree if it was built for the given version.
+
+        Args:
+            version: Current repository version token
+
+        Returns:
+            Cached tree, or None on miss
+        """
+        if self._tree is not None and self._version == version:
+            return self._tree
+        return None
+
+    def set(self, version: Hashable, tree: list[CategoryTreeDTO]) -> None:
+        """
+        Store tree built for the given version.
+
+        Args:
+            version: Repository version token the tree was built from
+            tree: Category tree DTOs
+        """
+        self._version = version
+        self._tree = tree
+
+    def clear(self) -> None:
+        """Drop cached tree."""
+        self._version = None
+        self._tree = None
+
+
+# =============================================================================
+# Shared instances
+# =============================================================================
+
+
+@lru_cache()
+def get_product_cache() -> TTLCache:
+    """
+    Get shared single-product cache.
+
+    Reads may be stale for up to ttl seconds.
+
+    Returns:
+        TTLCache instance
+    """
+    return TTLCache(maxsize=1024, ttl=30.0)
+
+
+@lru_cache()
+def get_category_cache() -> TTLCache:
+    """
+    Get shared single-category cache.
+
+    Reads may be stale for up to ttl seconds.
+
+    Returns:
+        TTLCache instance
+    """
+    return TTLCache(maxsize=1024, ttl=60.0)
+
+
+@lru_cache()
+def get_category_tree_cache() -> CategoryTreeCache:
+    """
+    Get shared category tree cache.
+
+    Entries are keyed by the repository version token.
+
+    Returns:
+        CategoryTreeCache instance
+    """
+    return CategoryTreeCache()
+
+
+def clear_catalog_caches() -> None:
+    """Drop all entries from the shared catalog caches."""
+    get_product_cache().clear()
+    get_category_cache().clear()
+    get_category_tree_cache().clear()
@@ -8,7 +8,19 @@ from datetime import datetime
 from typing import Final, Optional
 from uuid import UUID, uuid4
 
-from sqlalchemy import DateTime, ForeignKey, Integer, String, Text, func
+from sqlalchemy import (
+    DDL,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+    Uuid,
+    event,
+    func,
+    text,
+)
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from core.database import Base
@@ -23,17 +35,17 @@ class CategoryORM(Base):
 
     __tablename__ = "categories"
 
+    # Native uuid on PostgreSQL, CHAR(32) on other backends
     id: Mapped[UUID] = mapped_column(
-        String(36),
+        Uuid,
         primary_key=True,
-        default=lambda: str(uuid4()),
+        default=uuid4,
     )
     name: Mapped[str] = mapped_column(String(100), nullable=False, index=True)
-    parent_id: Mapped[Optional[str]] = mapped_column(
-        String(36),
+    parent_id: Mapped[Optional[UUID]] = mapped_column(
+        Uuid,
         ForeignKey("categories.id", ondelete="CASCADE"),
         nullable=True,
-        index=True,
     )
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
@@ -51,17 +63,22 @@ class CategoryORM(Base):
     # Self-referential relationship for category hierarchy
     # parent: many-to-one side (has foreign key parent_id)
     # children: one-to-many side (references parent's id via remote_side)
+    # Lazy loads raise: repositories read flat rows, and a lazy load
+    # here would silently turn tree or list reads into N+1 queries
     parent: Mapped[Optional["CategoryORM"]] = relationship(
         "CategoryORM",
         back_populates="children",
         foreign_keys=[parent_id],
         remote_side=[id],
+        lazy="raise",
     )
     children: Mapped[list["CategoryORM"]] = relationship(
         "CategoryORM",
         back_populates="parent",
         foreign_keys=[parent_id],
         order_by="CategoryORM.name",
+        lazy="raise",
+        passive_deletes=True,
     )
     products: Mapped[list["ProductORM"]] = relationship(
         "ProductORM",
@@ -71,6 +88,11 @@ class CategoryORM(Base):
 
     TABLE_NAME: Final = "categories"
 
+    __table_args__ = (
+        # Serves get_children: parent filter and name order from one index
+        Index("ix_categories_parent_name", "parent_id", "name"),
+    )
+
 
 class ProductORM(Base):
     """
@@ -81,17 +103,17 @@ class ProductORM(Base):
 
     __tablename__ = "products"
 
-    id: Mapped[str] = mapped_column(
-        String(36),
+    id: Mapped[UUID] = mapped_column(
+        Uuid,
         primary_key=True,
-        default=lambda: str(uuid4()),
+        default=uuid4,
     )
     name: Mapped[str] = mapped_column(String(255), nullable=False, index=True)
     description: Mapped[str] = mapped_column(Text, nullable=False)
     price: Mapped[int] = mapped_column(Integer, nullable=False)  # Stored as cents
     currency: Mapped[str] = mapped_column(String(3), nullable=False, default="USD")
-    category_id: Mapped[Optional[str]] = mapped_column(
-        String(36),
+    category_id: Mapped[Optional[UUID]] = mapped_column(
+        Uuid,
         ForeignKey("categories.id", ondelete="SET NULL"),
         nullable=True,
         index=True,
@@ -113,6 +135,7 @@ class ProductORM(Base):
     category: Mapped[Optional["CategoryORM"]] = relationship(
         "CategoryORM",
         back_populates="products",
+        lazy="raise",
     )
     # Note: cart_items relationship defined in cart.infrastructure.orm
     # to avoid circular import issues
@@ -121,7 +144,35 @@ class ProductORM(Base):
 
     # Indexes for search
     __table_args__ = (
-        # GIN index for full-text search on name and description
-        # Requires gin extension in PostgreSQL
-        # Index('ix_products_name_tsv', name_tsv, postgresql_using='gin'),
+        # Trigram GIN index serving ILIKE '%q%' on name and description
+        # Requires pg_trgm extension in PostgreSQL
+        Index(
+            "ix_products_search_trgm",
+            "name",
+            "description",
+            postgresql_using="gin",
+            postgresql_ops={
+                "name": "gin_trgm_ops",
+                "description": "gin_trgm_ops",
+            },
+        ).ddl_if(dialect="postgresql"),
+        # Composite indexes for category listing ordered by date or price
+        Index("ix_products_cat_created", "category_id", "created_at"),
+        Index("ix_products_cat_price", "category_id", "price"),
+        # Partial index for in-stock listings
+        Index(
+            "ix_products_instock",
+            "category_id",
+            "created_at",
+            postgresql_where=text("stock > 0"),
+            sqlite_where=text("stock > 0"),
+        ),
     )
+
+
+# Make sure pg_trgm is available when tables are created without migrations
+event.listen(
+    ProductORM.__table__,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql"),
+)
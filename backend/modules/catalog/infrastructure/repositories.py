@@ -4,12 +4,15 @@ SQLAlchemy repository implementations for Catalog module.
 Implements repository interfaces using SQLAlchemy.
 """
 
-from typing import Optional
+from collections import defaultdict
+from collections.abc import Hashable, Sequence
+from functools import lru_cache
+from typing import Any, Optional
 from uuid import UUID
 
-from sqlalchemy import select, func, or_, and_
+from sqlalchemy import ColumnElement, Row, Select, bindparam, select, func, or_, and_, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import InstrumentedAttribute
 
 from modules.catalog.domain.entities import Category, Product
 from modules.catalog.domain.repositories import ICategoryRepository, IProductRepository
@@ -17,6 +20,179 @@ from modules.catalog.domain.value_objects import Price
 from modules.catalog.infrastructure.orm import CategoryORM, ProductORM
 
 
+# Plain column selects return lightweight rows instead of ORM instances,
+# skipping identity-map and instance-state setup for read-only queries.
+_PRODUCT_COLUMNS = (
+    ProductORM.id,
+    ProductORM.name,
+    ProductORM.description,
+    ProductORM.price,
+    ProductORM.currency,
+    ProductORM.category_id,
+    ProductORM.stock,
+    ProductORM.created_at,
+    ProductORM.updated_at,
+)
+
+
+_CATEGORY_COLUMNS = (
+    CategoryORM.id,
+    CategoryORM.name,
+    CategoryORM.parent_id,
+    CategoryORM.created_at,
+    CategoryORM.updated_at,
+)
+
+
+# Sort field -> column. Indexes serving each order (with category_id
+# filter when given): name -> ix_products_name, price ->
+# ix_products_cat_price, created_at -> ix_products_cat_created /
+# ix_products_instock. Desc order scans the index backwards.
+_ORDER_COLUMNS: dict[str, InstrumentedAttribute] = {
+    "name": ProductORM.name,
+    "price": ProductORM.price,
+    "created_at": ProductORM.created_at,
+}
+
+
+def _price_to_cents(price: float) -> int:
+    """
+    Convert a price filter to stored integer cents.
+
+    Rounds instead of truncating, so 0.29 maps to 29 rather than 28.
+
+    Args:
+        price: Price amount
+
+    Returns:
+        Price in cents
+    """
+    return round(price * 100)
+
+
+def _search_condition(pattern: Any) -> ColumnElement[bool]:
+    """
+    Build the product search predicate.
+
+    Case-insensitive substring match on name or description. On
+    PostgreSQL it is served by the ix_products_search_trgm GIN index.
+
+    Args:
+        pattern: ILIKE pattern, a literal or a bound parameter
+
+    Returns:
+        SQL boolean expression
+    """
+    return or_(
+        ProductORM.name.ilike(pattern),
+        ProductORM.description.ilike(pattern),
+    )
+
+
+def _filter_params(
+    category_id: Optional[UUID] = None,
+    search_query: Optional[str] = None,
+    price_min: Optional[float] = None,
+    price_max: Optional[float] = None,
+) -> dict[str, Any]:
+    """
+    Collect bound parameter values for the active product filters.
+
+    The key set doubles as the filter shape passed to _product_query.
+
+    Args:
+        category_id: Filter by category ID
+        search_query: Search by name or description
+        price_min: Minimum price filter
+        price_max: Maximum price filter
+
+    Returns:
+        Parameter name -> value for each filter that is set
+    """
+    params: dict[str, Any] = {}
+    if category_id is not None:
+        params["category_id"] = category_id
+    if search_query:
+        params["search_pattern"] = f"%{search_query}%"
+    if price_min is not None:
+        params["price_min"] = _price_to_cents(price_min)
+    if price_max is not None:
+        params["price_max"] = _price_to_cents(price_max)
+    return params
+
+
+@lru_cache(maxsize=256)
+def _product_query(
+    kind: str,
+    filters: frozenset[str],
+    in_stock: bool = False,
+    order_by: Optional[str] = None,
+    order_dir: str = "desc",
+    keyset: bool = False,
+) -> Select:
+    """
+    Build the product select for one query shape, memoized.
+
+    Filter values, cursor and pagination are bound parameters, so one
+    statement serves every request of the same shape. Reusing the
+    statement object skips rebuilding the expression tree and lets
+    SQLAlchemy reuse its memoized cache key for the compiled SQL.
+
+    Args:
+        kind: "rows", "rows_total" (rows plus window count) or "count"
+        filters: Names of the active filter parameters
+        in_stock: Only include in-stock items
+        order_by: Sort field; None leaves the query unordered and unpaged
+        order_dir: Sort direction
+        keyset: Continue after bound (after_value, after_id)
+
+    Returns:
+        Select statement expecting the matching bound parameters
+    """
+    if kind == "count":
+        query = select(func.count(ProductORM.id))
+    elif kind == "rows_total":
+        query = select(*_PRODUCT_COLUMNS, func.count().over().label("total"))
+    else:
+        query = select(*_PRODUCT_COLUMNS)
+
+    if "category_id" in filters:
+        query = query.where(ProductORM.category_id == bindparam("category_id"))
+
+    if "search_pattern" in filters:
+        query = query.where(_search_condition(bindparam("search_pattern")))
+
+    if "price_min" in filters:
+        query = query.where(ProductORM.price >= bindparam("price_min"))
+
+    if "price_max" in filters:
+        query = query.where(ProductORM.price <= bindparam("price_max"))
+
+    if in_stock:
+        query = query.where(ProductORM.stock > 0)
+
+    if order_by is None:
+        return query
+
+    order_column = _ORDER_COLUMNS[order_by]
+    if keyset:
+        # Row-value comparison seeks straight past the previous page
+        key = tuple_(order_column, ProductORM.id)
+        bound = tuple_(
+            bindparam("after_value", type_=order_column.type),
+            bindparam("after_id", type_=ProductORM.id.type),
+        )
+        query = query.where(key < bound if order_dir == "desc" else key > bound)
+
+    # ID breaks ties so pages are stable and keyset cursors are unique
+    if order_dir == "desc":
+        query = query.order_by(order_column.desc(), ProductORM.id.desc())
+    else:
+        query = query.order_by(order_column.asc(), ProductORM.id.asc())
+
+    return query.limit(bindparam("limit")).offset(bindparam("offset"))
+
+
 class SQLAlchemyProductRepository(IProductRepository):
     """
     SQLAlchemy implementation of product repository.
@@ -44,14 +220,14 @@ class SQLAlchemyProductRepository(IProductRepository):
             Product if found, None otherwise
         """
         result = await self._session.execute(
-            select(ProductORM).where(ProductORM.id == str(product_id))
+            select(*_PRODUCT_COLUMNS).where(ProductORM.id == product_id)
         )
-        orm_product = result.scalar_one_or_none()
+        row = result.one_or_none()
 
-        if orm_product is None:
+        if row is None:
             return None
 
-        return self._to_entity(orm_product)
+        return self._to_entity(row)
 
     async def get_all(
         self,
@@ -64,6 +240,7 @@ class SQLAlchemyProductRepository(IProductRepository):
         in_stock: bool = False,
         order_by: str = "created_at",
         order_dir: str = "desc",
+        after: Optional[tuple[Any, UUID]] = None,
     ) -> list[Product]:
         """
         Get all products with optional filtering and sorting.
@@ -78,61 +255,96 @@ class SQLAlchemyProductRepository(IProductRepository):
             in_stock: Only show in-stock items
             order_by: Sort field
             order_dir: Sort direction
+            after: (sort value, product ID) to continue after
 
         Returns:
             List of products
         """
-        query = select(ProductORM)
-
-        # Apply filters
-        if category_id is not None:
-            query = query.where(ProductORM.category_id == str(category_id))
-
-        if search_query:
-            search_pattern = f"%{search_query}%"
-            query = query.where(
-                or_(
-                    ProductORM.name.ilike(search_pattern),
-                    ProductORM.description.ilike(search_pattern),
-                )
-            )
+        params = _filter_params(category_id, search_query, price_min, price_max)
+        query = _product_query(
+            "rows",
+            frozenset(params),
+            in_stock,
+            *self._normalize_ordering(order_by, order_dir),
+            keyset=after is not None,
+        )
+        if after is not None:
+            params["after_value"] = after[0]
+            params["after_id"] = after[1]
+        params["limit"] = limit
+        params["offset"] = offset
 
-        if price_min is not None:
-            # Price is stored as integer (cents)
-            min_cents = int(price_min * 100)
-            query = query.where(ProductORM.price >= min_cents)
+        result = await self._session.execute(query, params)
 
-        if price_max is not None:
-            # Price is stored as integer (cents)
-            max_cents = int(price_max * 100)
-            query = query.where(ProductORM.price <= max_cents)
+        return self._to_entities(result.all())
 
-        if in_stock:
-            query = query.where(ProductORM.stock > 0)
+    async def list_with_count(
+        self,
+        limit: int = 100,
+        offset: int = 0,
+        category_id: Optional[UUID] = None,
+        search_query: Optional[str] = None,
+        price_min: Optional[float] = None,
+        price_max: Optional[float] = None,
+        in_stock: bool = False,
+        order_by: str = "created_at",
+        order_dir: str = "desc",
+    ) -> tuple[list[Product], int]:
+        """
+        Get a page of products together with the total match count.
 
-        # Apply sorting
-        order_column = self._get_order_column(order_by)
-        if order_dir == "desc":
-            query = query.order_by(order_column.desc())
-        else:
-            query = query.order_by(order_column.asc())
+        The total is computed with a window function (``count(*) OVER ()``)
+        so the page and the count share a single query.
 
-        # Apply pagination
-        query = query.limit(limit).offset(offset)
+        Args:
+            limit: Maximum number of products to return
+            offset: Number of products to skip
+            category_id: Filter by category ID
+            search_query: Search by name or description
+            price_min: Minimum price filter
+            price_max: Maximum price filter
+            in_stock: Only show in-stock items
+            order_by: Sort field
+            order_dir: Sort direction
 
-        result = await self._session.execute(query)
-        orm_products = result.scalars().all()
+        Returns:
+            Tuple of (products, total number of matching products)
+        """
+        params = _filter_params(category_id, search_query, price_min, price_max)
+        query = _product_query(
+            "rows_total",
+            frozenset(params),
+            in_stock,
+            *self._normalize_ordering(order_by, order_dir),
+        )
+        params["limit"] = limit
+        params["offset"] = offset
+
+        result = await self._session.execute(query, params)
+        rows = result.all()
+
+        if rows:
+            total = rows[0].total
+        elif offset > 0:
+            # Page past the end: window count has no row to ride on
+            total = await self.count(
+                category_id=category_id,
+                search_query=search_query,
+                price_min=price_min,
+                price_max=price_max,
+                in_stock=in_stock,
+            )
+        else:
+            total = 0
 
-        return [self._to_entity(p) for p in orm_products]
+        return self._to_entities(rows), total
 
-    def _get_order_column(self, order_by: str):
-        """Get SQLAlchemy column for sorting."""
-        if order_by == "name":
-            return ProductORM.name
-        elif order_by == "price":
-            return ProductORM.price
-        else:  # created_at
-            return ProductORM.created_at
+    @staticmethod
+    def _normalize_ordering(order_by: str, order_dir: str) -> tuple[str, str]:
+        """Map sort options onto the finite set of cached query shapes."""
+        if order_by not in _ORDER_COLUMNS:
+            order_by = "created_at"
+        return order_by, "desc" if order_dir == "desc" else "asc"
 
     async def search(
         self,
@@ -151,23 +363,12 @@ class SQLAlchemyProductRepository(IProductRepository):
         Returns:
             List of matching products
         """
-        search_pattern = f"%{query}%"
+        q = _product_query("rows", frozenset({"search_pattern"}), False, "name", "asc")
+        params = {"search_pattern": f"%{query}%", "limit": limit, "offset": offset}
 
-        q = (
-            select(ProductORM)
-            .where(
-                (ProductORM.name.ilike(search_pattern))
-                | (ProductORM.description.ilike(search_pattern))
-            )
-            .order_by(ProductORM.name)
-            .limit(limit)
-            .offset(offset)
-        )
+        result = await self._session.execute(q, params)
 
-        result = await self._session.execute(q)
-        orm_products = result.scalars().all()
-
-        return [self._to_entity(p) for p in orm_products]
+        return self._to_entities(result.all())
 
     async def count(
         self,
@@ -190,55 +391,68 @@ class SQLAlchemyProductRepository(IProductRepository):
         Returns:
             Number of products
         """
-        query = select(func.count(ProductORM.id))
-
-        # Apply filters (same as get_all)
-        if category_id is not None:
-            query = query.where(ProductORM.category_id == str(category_id))
+        params = _filter_params(category_id, search_query, price_min, price_max)
+        query = _product_query("count", frozenset(params), in_stock)
 
-        if search_query:
-            search_pattern = f"%{search_query}%"
-            query = query.where(
-                or_(
-                    ProductORM.name.ilike(search_pattern),
-                    ProductORM.description.ilike(search_pattern),
-                )
-            )
-
-        if price_min is not None:
-            min_cents = int(price_min * 100)
-            query = query.where(ProductORM.price >= min_cents)
+        result = await self._session.execute(query, params)
+        return result.scalar() or 0
 
-        if price_max is not None:
-            max_cents = int(price_max * 100)
-            query = query.where(ProductORM.price <= max_cents)
+    def _to_entity(self, row: Sequence[Any]) -> Product:
+        """
+        Convert a product row to domain entity.
 
-        if in_stock:
-            query = query.where(ProductORM.stock > 0)
+        Args:
+            row: Row of _PRODUCT_COLUMNS
 
-        result = await self._session.execute(query)
-        return result.scalar() or 0
+        Returns:
+            Product domain entity
+        """
+        return self._to_entities((row,))[0]
 
-    def _to_entity(self, orm_product: ProductORM) -> Product:
+    @staticmethod
+    def _to_entities(rows: Sequence[Sequence[Any]]) -> list[Product]:
         """
-        Convert ORM model to domain entity.
+        Convert product rows to domain entities in one pass.
+
+        Rows are unpacked positionally, which is cheaper than attribute
+        access on Row objects. Extra trailing columns are ignored.
 
         Args:
-            orm_product: ProductORM instance
+            rows: Rows starting with _PRODUCT_COLUMNS
 
         Returns:
-            Product domain entity
+            List of Product domain entities
         """
-        return Product(
-            id=UUID(orm_product.id) if orm_product.id else None,
-            name=orm_product.name,
-            description=orm_product.description,
-            price=Price.from_int(orm_product.price, orm_product.currency),
-            category_id=UUID(orm_product.category_id) if orm_product.category_id else None,
-            stock=orm_product.stock,
-            created_at=orm_product.created_at,
-            updated_at=orm_product.updated_at,
-        )
+        from_trusted = Product.from_trusted
+        from_int = Price.from_int
+        width = len(_PRODUCT_COLUMNS)
+
+        products = []
+        for row in rows:
+            (
+                product_id,
+                name,
+                description,
+                price,
+                currency,
+                category_id,
+                stock,
+                created_at,
+                updated_at,
+            ) = row[:width]
+            products.append(
+                from_trusted(
+                    id=product_id,
+                    name=name,
+                    description=description,
+                    price=from_int(price, currency),
+                    category_id=category_id,
+                    stock=stock,
+                    created_at=created_at,
+                    updated_at=updated_at,
+                )
+            )
+        return products
 
 
 class SQLAlchemyCategoryRepository(ICategoryRepository):
@@ -268,9 +482,7 @@ class SQLAlchemyCategoryRepository(ICategoryRepository):
             Category if found, None otherwise
         """
         result = await self._session.execute(
-            select(CategoryORM)
-            .options(selectinload(CategoryORM.children))
-            .where(CategoryORM.id == str(category_id))
+            select(CategoryORM).where(CategoryORM.id == category_id)
         )
         orm_category = result.scalar_one_or_none()
 
@@ -312,14 +524,59 @@ class SQLAlchemyCategoryRepository(ICategoryRepository):
             List of root categories with their children
         """
         result = await self._session.execute(
-            select(CategoryORM)
-            .options(selectinload(CategoryORM.children))
-            .where(CategoryORM.parent_id.is_(None))
-            .order_by(CategoryORM.name)
+            select(*_CATEGORY_COLUMNS).order_by(CategoryORM.name)
         )
-        orm_categories = result.scalars().all()
+        rows = result.all()
+
+        # Index the flat rows by parent once; buckets keep name order
+        children_by_parent: dict[Optional[UUID], list[Row]] = defaultdict(list)
+        for row in rows:
+            children_by_parent[row.parent_id].append(row)
+
+        roots = children_by_parent.get(None, [])
+
+        # Pre-order walk from the roots; reversed, it visits children first
+        visit_order: list[Row] = []
+        stack = list(roots)
+        while stack:
+            row = stack.pop()
+            visit_order.append(row)
+            stack.extend(children_by_parent.get(row.id, ()))
+
+        # Unpack rows positionally, cheaper than Row attribute access
+        built: dict[UUID, Category] = {}
+        for category_id, name, parent_id, created_at, updated_at in reversed(
+            visit_order
+        ):
+            built[category_id] = Category.from_trusted(
+                id=category_id,
+                name=name,
+                parent_id=parent_id,
+                children=[
+                    built[child[0]]
+                    for child in children_by_parent.get(category_id, ())
+                ],
+                created_at=created_at,
+                updated_at=updated_at,
+            )
+
+        return [built[root.id] for root in roots]
+
+    async def get_tree_version(self) -> Hashable:
+        """
+        Get a version token for the category hierarchy.
+
+        Combines row count (changes on insert/delete) with the latest
+        updated_at (changes on update).
 
-        return [self._to_entity(c, load_children=True) for c in orm_categories]
+        Returns:
+            Tuple of (category count, latest updated_at)
+        """
+        result = await self._session.execute(
+            select(func.count(CategoryORM.id), func.max(CategoryORM.updated_at))
+        )
+        count, last_updated = result.one()
+        return count, last_updated
 
     async def get_children(self, parent_id: UUID) -> list[Category]:
         """
@@ -333,34 +590,33 @@ class SQLAlchemyCategoryRepository(ICategoryRepository):
         """
         result = await self._session.execute(
             select(CategoryORM)
-            .where(CategoryORM.parent_id == str(parent_id))
+            .where(CategoryORM.parent_id == parent_id)
             .order_by(CategoryORM.name)
         )
         orm_categories = result.scalars().all()
 
         return [self._to_entity(c) for c in orm_categories]
 
-    def _to_entity(self, orm_category: CategoryORM, load_children: bool = False) -> Category:
+    def _to_entity(
+        self,
+        orm_category: CategoryORM,
+        children: Optional[list[Category]] = None,
+    ) -> Category:
         """
         Convert ORM model to domain entity.
 
         Args:
             orm_category: CategoryORM instance
-            load_children: Whether to load children recursively
+            children: Already converted child categories
 
         Returns:
             Category domain entity
         """
-        children = []
-        if load_children and orm_category.children:
-            for child in orm_category.children:
-                children.append(self._to_entity(child, load_children=True))
-
-        return Category(
-            id=UUID(orm_category.id) if orm_category.id else None,
+        return Category.from_trusted(
+            id=orm_category.id,
             name=orm_category.name,
-            parent_id=UUID(orm_category.parent_id) if orm_category.parent_id else None,
-            children=children,
+            parent_id=orm_category.parent_id,
+            children=children if children is not None else [],
             created_at=orm_category.created_at,
             updated_at=orm_category.updated_at,
         )
@@ -4,15 +4,24 @@ API routes for Catalog module.
 FastAPI router for catalog endpoints.
 """
 
-from typing import Optional
+from typing import Any, Optional
 from uuid import UUID
 
+import orjson
 from fastapi import APIRouter, Depends, Query, status
+from fastapi.responses import Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from core.database import get_db
 from modules.catalog.application.dto import ProductFilterDTO
 from modules.catalog.application.services import CategoryService, ProductService
+from modules.catalog.infrastructure.cache import (
+    CategoryTreeCache,
+    TTLCache,
+    get_category_cache,
+    get_category_tree_cache,
+    get_product_cache,
+)
 from modules.catalog.infrastructure.repositories import (
     SQLAlchemyCategoryRepository,
     SQLAlchemyProductRepository,
@@ -23,6 +32,8 @@ from modules.catalog.presentation.api.schemas import (
     ProductListResponse,
     ProductResponse,
     ProductSearchQuery,
+    dump_category_list,
+    dump_product_list,
 )
 
 router = APIRouter()
@@ -30,34 +41,44 @@ router = APIRouter()
 
 async def get_product_service(
     db: AsyncSession = Depends(get_db),
+    product_cache: TTLCache = Depends(get_product_cache),
 ) -> ProductService:
     """
     Get product service instance.
 
     Args:
         db: Database session
+        product_cache: Shared single-product cache
 
     Returns:
         ProductService instance
     """
     repository = SQLAlchemyProductRepository(db)
-    return ProductService(repository)
+    return ProductService(repository, product_cache=product_cache)
 
 
 async def get_category_service(
     db: AsyncSession = Depends(get_db),
+    tree_cache: CategoryTreeCache = Depends(get_category_tree_cache),
+    category_cache: TTLCache = Depends(get_category_cache),
 ) -> CategoryService:
     """
     Get category service instance.
 
     Args:
         db: Database session
+        tree_cache: Shared category tree cache
+        category_cache: Shared single-category cache
 
     Returns:
         CategoryService instance
     """
     repository = SQLAlchemyCategoryRepository(db)
-    return CategoryService(repository)
+    return CategoryService(
+        repository,
+        tree_cache=tree_cache,
+        category_cache=category_cache,
+    )
 
 
 # =============================================================================
@@ -99,11 +120,12 @@ async def list_products(
     order_by: str = Query(
         default="created_at",
         description="Sort field (name, price, created_at)",
+        pattern="^(name|price|created_at)$",
     ),
     order_dir: str = Query(
         default="desc",
         description="Sort direction (asc, desc)",
-        regex="^(asc|desc)$",
+        pattern="^(asc|desc)$",
     ),
     limit: int = Query(
         default=100,
@@ -116,8 +138,12 @@ async def list_products(
         ge=0,
         description="Number of products to skip",
     ),
+    cursor: Optional[str] = Query(
+        default=None,
+        description="Cursor from next_cursor of the previous page (replaces offset)",
+    ),
     service: ProductService = Depends(get_product_service),
-) -> ProductListResponse:
+) -> Response:
     """
     List all products with optional filtering and sorting.
 
@@ -131,10 +157,11 @@ async def list_products(
         order_dir: Sort direction
         limit: Page size
         offset: Page offset
+        cursor: Keyset cursor
         service: Product service
 
     Returns:
-        ProductListResponse with products and metadata
+        ProductListResponse JSON with products and metadata
     """
     filters = ProductFilterDTO(
         category_id=UUID(category_id) if category_id else None,
@@ -146,17 +173,21 @@ async def list_products(
         order_dir=order_dir,
         limit=limit,
         offset=offset,
+        cursor=cursor,
     )
 
     result = await service.list_products(filters)
 
-    return ProductListResponse(
+    response = ProductListResponse(
         items=[_product_to_response(item) for item in result.items],
         total=result.total,
         limit=result.limit,
         offset=result.offset,
+        next_cursor=result.next_cursor,
     )
 
+    return _json_response(response.model_dump_json().encode())
+
 
 @router.get(
     "/products/search",
@@ -170,7 +201,7 @@ async def search_products(
     limit: int = Query(default=100, ge=1, le=1000),
     offset: int = Query(default=0, ge=0),
     service: ProductService = Depends(get_product_service),
-) -> list[ProductResponse]:
+) -> Response:
     """
     Search products by query string.
 
@@ -181,11 +212,13 @@ async def search_products(
         service: Product service
 
     Returns:
-        List of matching products
+        JSON list of matching products
     """
     results = await service.search_products(query=q, limit=limit, offset=offset)
 
-    return [_product_to_response(item) for item in results]
+    return _json_response(
+        dump_product_list([_product_to_response(item) for item in results])
+    )
 
 
 @router.get(
@@ -233,7 +266,7 @@ async def list_categories(
     limit: int = Query(default=100, ge=1, le=1000),
     offset: int = Query(default=0, ge=0),
     service: CategoryService = Depends(get_category_service),
-) -> list[CategoryResponse]:
+) -> Response:
     """
     List all categories.
 
@@ -243,11 +276,13 @@ async def list_categories(
         service: Category service
 
     Returns:
-        List of categories
+        JSON list of categories
     """
     categories = await service.list_categories(limit=limit, offset=offset)
 
-    return [_category_to_response(cat) for cat in categories]
+    return _json_response(
+        dump_category_list([_category_to_response(cat) for cat in categories])
+    )
 
 
 @router.get(
@@ -259,7 +294,7 @@ async def list_categories(
 )
 async def get_category_tree(
     service: CategoryService = Depends(get_category_service),
-) -> list[CategoryTreeResponse]:
+) -> Response:
     """
     Get category hierarchy tree.
 
@@ -267,11 +302,11 @@ async def get_category_tree(
         service: Category service
 
     Returns:
-        List of root categories with children
+        JSON list of root categories with children
     """
     categories = await service.get_category_tree()
 
-    return [_category_to_tree_response(cat) for cat in categories]
+    return _json_response(orjson.dumps(_categories_to_tree_dicts(categories)))
 
 
 @router.get(
@@ -308,36 +343,54 @@ async def get_category(
 # =============================================================================
 
 
+def _json_response(body: bytes) -> Response:
+    """Wrap pre-serialized JSON, bypassing response_model serialization."""
+    return Response(content=body, media_type="application/json")
+
+
 def _product_to_response(dto) -> ProductResponse:
-    """Convert ProductDTO to ProductResponse."""
-    return ProductResponse(
+    """Convert ProductDTO to ProductResponse, skipping validation of trusted data."""
+    return ProductResponse.model_construct(
         id=dto.id,
         name=dto.name,
         description=dto.description,
-        price=dto.price,
+        price_cents=dto.price_cents,
         currency=dto.currency,
         category_id=dto.category_id,
         stock=dto.stock,
         is_available=dto.is_available,
-        created_at=dto.created_at if hasattr(dto, "created_at") else None,
-        updated_at=dto.updated_at if hasattr(dto, "updated_at") else None,
     )
 
 
 def _category_to_response(dto) -> CategoryResponse:
-    """Convert CategoryDTO to CategoryResponse."""
-    return CategoryResponse(
+    """Convert CategoryDTO to CategoryResponse, skipping validation of trusted data."""
+    return CategoryResponse.model_construct(
         id=dto.id,
         name=dto.name,
         parent_id=dto.parent_id,
     )
 
 
-def _category_to_tree_response(dto) -> CategoryTreeResponse:
-    """Convert CategoryDTO to CategoryTreeResponse."""
-    return CategoryTreeResponse(
-        id=dto.id,
-        name=dto.name,
-        parent_id=dto.parent_id,
-        children=[_category_to_tree_response(child) for child in dto.children],
-    )
+def _categories_to_tree_dicts(dtos) -> list[dict[str, Any]]:
+    """
+    Convert CategoryTreeDTOs to CategoryTreeResponse-shaped dicts.
+
+    Built iteratively as plain dicts, so response serialization never
+    walks the recursive CategoryTreeResponse schema.
+    """
+    roots: list[dict[str, Any]] = []
+    stack = [(dto, roots) for dto in reversed(dtos)]
+
+    while stack:
+        dto, siblings = stack.pop()
+        children: list[dict[str, Any]] = []
+        siblings.append({
+            "id": dto.id,
+            "name": dto.name,
+            "parent_id": dto.parent_id,
+            "children": children,
+        })
+        if dto.children:
+            stack.extend([(child, children) for child in reversed(dto.children)])
+
+    return roots
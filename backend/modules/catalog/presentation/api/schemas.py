@@ -5,10 +5,30 @@ Pydantic models for request/response validation.
 """
 
 from datetime import datetime
-from typing import Optional
+from typing import Any, ClassVar, Optional
 from uuid import UUID
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import (
+    BaseModel,
+    Field,
+    JsonValue,
+    TypeAdapter,
+    computed_field,
+)
+
+
+def _inject_examples(schema: dict[str, Any], cls: type) -> None:
+    """
+    Add a schema class's examples to its JSON schema.
+
+    Runs only when the JSON schema is generated (e.g. for /openapi.json),
+    keeping the example data out of model_config.
+
+    Args:
+        schema: JSON schema being generated
+        cls: Schema class declaring an ``examples`` class variable
+    """
+    schema["examples"] = cls.examples
 
 
 class ProductResponse(BaseModel):
@@ -19,38 +39,50 @@ class ProductResponse(BaseModel):
         id: Product identifier
         name: Product name
         description: Product description
-        price: Product price
+        price_cents: Product price in minor units (cents)
         currency: Price currency
         category_id: Category identifier
         stock: Available stock
         is_available: Availability status
         created_at: Creation timestamp
         updated_at: Last update timestamp
+        price: Product price amount, derived from price_cents
     """
 
-    id: str
-    name: str = Field(..., min_length=1, max_length=255)
-    description: str = Field(..., max_length=5000)
-    price: float = Field(..., gt=0)
-    currency: str = Field(default="USD", min_length=3, max_length=3)
-    category_id: Optional[str] = None
+    # String lengths are enforced by the domain value objects; only the
+    # numeric invariants are checked here
+    id: UUID
+    name: str
+    description: str
+    price_cents: int = Field(..., gt=0)
+    currency: str = "USD"
+    category_id: Optional[UUID] = None
     stock: int = Field(..., ge=0)
     is_available: bool
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
 
-    model_config = {"json_schema_extra": {"example": {
+    examples: ClassVar[list[JsonValue]] = [{
         "id": "123e4567-e89b-12d3-a456-426614174000",
         "name": "Wireless Headphones",
         "description": "High-quality wireless headphones with noise cancellation",
-        "price": 99.99,
+        "price_cents": 9999,
         "currency": "USD",
         "category_id": "123e4567-e89b-12d3-a456-426614174001",
         "stock": 50,
         "is_available": True,
         "created_at": "2024-01-01T00:00:00Z",
         "updated_at": "2024-01-01T00:00:00Z",
-    }}}
+        "price": 99.99,
+    }]
+
+    model_config = {"json_schema_extra": _inject_examples}
+
+    @computed_field
+    @property
+    def price(self) -> float:
+        """Product price amount in major units."""
+        return self.price_cents / 100
 
 
 class ProductListResponse(BaseModel):
@@ -59,15 +91,21 @@ class ProductListResponse(BaseModel):
 
     Attributes:
         items: List of products
-        total: Total number of products
+        total: Total number of products (null for cursor pages)
         limit: Page size
         offset: Page offset
+        next_cursor: Cursor for the next page (null on the last page)
     """
 
     items: list[ProductResponse]
-    total: int
+    total: Optional[int]
     limit: int = Field(..., ge=1, le=1000)
     offset: int = Field(..., ge=0)
+    next_cursor: Optional[str] = None
+
+    # Items passed as ProductResponse instances are kept, not revalidated;
+    # they must be built from already validated data
+    model_config = {"revalidate_instances": "never"}
 
 
 class ProductSearchQuery(BaseModel):
@@ -95,15 +133,17 @@ class CategoryResponse(BaseModel):
         parent_id: Parent category identifier
     """
 
-    id: str
+    id: UUID
     name: str = Field(..., min_length=1, max_length=100)
-    parent_id: Optional[str] = None
+    parent_id: Optional[UUID] = None
 
-    model_config = {"json_schema_extra": {"example": {
+    examples: ClassVar[list[JsonValue]] = [{
         "id": "123e4567-e89b-12d3-a456-426614174001",
         "name": "Electronics",
         "parent_id": None,
-    }}}
+    }]
+
+    model_config = {"json_schema_extra": _inject_examples}
 
 
 class CategoryTreeResponse(BaseModel):
@@ -117,12 +157,12 @@ class CategoryTreeResponse(BaseModel):
         children: Child categories
     """
 
-    id: str
+    id: UUID
     name: str = Field(..., min_length=1, max_length=100)
-    parent_id: Optional[str] = None
+    parent_id: Optional[UUID] = None
     children: list["CategoryTreeResponse"] = Field(default_factory=list)
 
-    model_config = {"json_schema_extra": {"example": {
+    examples: ClassVar[list[JsonValue]] = [{
         "id": "123e4567-e89b-12d3-a456-426614174001",
         "name": "Electronics",
         "parent_id": None,
@@ -134,8 +174,46 @@ class CategoryTreeResponse(BaseModel):
                 "children": [],
             }
         ],
-    }}}
+    }]
+
+    model_config = {"json_schema_extra": _inject_examples}
 
 
 # Enable forward references for recursive models
 CategoryTreeResponse.model_rebuild()
+
+
+# =============================================================================
+# List serializers
+# =============================================================================
+
+# Built once at import; each dump is a single pydantic-core call
+_PRODUCT_LIST_ADAPTER = TypeAdapter(list[ProductResponse])
+_CATEGORY_LIST_ADAPTER = TypeAdapter(list[CategoryResponse])
+
+
+def dump_product_list(items: list[ProductResponse]) -> bytes:
+    """
+    Serialize product responses to a JSON array.
+
+    Args:
+        items: Product responses
+
+    Returns:
+        JSON bytes
+    """
+    return _PRODUCT_LIST_ADAPTER.dump_json(items)
+
+
+def dump_category_list(items: list[CategoryResponse]) -> bytes:
+    """
+    Serialize category responses to a JSON array.
+
+    Args:
+        items: Category responses
+
+    Returns:
+        JSON bytes
+    """
+    return _CATEGORY_LIST_ADAPTER.dump_json(items)
+
@@ -3,15 +3,24 @@ Pytest configuration and fixtures for Catalog module tests.
 """
 
 import pytest
+from collections.abc import Callable
+from decimal import Decimal
+from types import SimpleNamespace
 from uuid import UUID, uuid4
-from unittest.mock import AsyncMock, Mock
 
+from modules.catalog.application.services import CategoryService, ProductService
 from modules.catalog.domain.entities import Category, Product
-from modules.catalog.domain.repositories import IProductRepository, ICategoryRepository
-from modules.catalog.domain.value_objects import Price, ProductName, Description, Quantity
+from modules.catalog.domain.value_objects import (
+    Description,
+    Money,
+    Price,
+    ProductName,
+    Quantity,
+)
 from modules.catalog.tests.fixtures import (
     generate_category_id,
     generate_product_id,
+    make_product_batch,
     create_test_price,
     create_test_product_name,
     create_test_description,
@@ -20,58 +29,79 @@ from modules.catalog.tests.fixtures import (
     create_test_product,
     create_category_with_children,
 )
+from tests_support.fakes import make_fake_product_repo, make_fake_repo
 
 
 # ============================================================================
 # Basic ID Fixtures
 # ============================================================================
 
-@pytest.fixture
+# IDs and value objects are immutable, so one instance serves the session
+
+@pytest.fixture(scope="session")
 def category_id() -> UUID:
     """Generate category ID."""
     return generate_category_id()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def product_id() -> UUID:
     """Generate product ID."""
     return generate_product_id()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def parent_category_id() -> UUID:
     """Generate parent category ID."""
     return uuid4()
 
 
+@pytest.fixture
+def fresh_uuid() -> Callable[[], UUID]:
+    """Factory for tests that need a new unique ID per call."""
+    return uuid4
+
+
 # ============================================================================
 # Value Object Fixtures
 # ============================================================================
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def test_price() -> Price:
     """Create test price."""
     return create_test_price(29.99, "USD")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def usd_money() -> Money:
+    """Create 100.50 USD money."""
+    return Money(amount=Decimal("100.50"), currency="USD")
+
+
+@pytest.fixture(scope="session")
 def test_product_name() -> ProductName:
     """Create test product name."""
     return create_test_product_name("Test Product")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def test_description() -> Description:
     """Create test description."""
     return create_test_description("Test product description")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def test_quantity() -> Quantity:
     """Create test quantity."""
     return create_test_quantity(50)
 
 
+@pytest.fixture(scope="session")
+def quantity_set() -> tuple[Quantity, Quantity, Quantity]:
+    """Create two equal quantities (100) and one different quantity (200)."""
+    return Quantity(value=100), Quantity(value=100), Quantity(value=200)
+
+
 # ============================================================================
 # Entity Fixtures
 # ============================================================================
@@ -88,6 +118,19 @@ def sample_category_with_children() -> Category:
     return create_category_with_children(num_children=3)
 
 
+@pytest.fixture
+def electronics_tree() -> tuple[Category, Category, Category]:
+    """Create Electronics -> (Laptops, Phones) category tree."""
+    electronics = Category(id=uuid4(), name="Electronics")
+    laptops = Category(id=uuid4(), name="Laptops", parent_id=electronics.id)
+    phones = Category(id=uuid4(), name="Phones", parent_id=electronics.id)
+
+    electronics.add_child(laptops)
+    electronics.add_child(phones)
+
+    return electronics, laptops, phones
+
+
 @pytest.fixture
 def sample_product(
     test_product_name: ProductName,
@@ -143,49 +186,45 @@ def low_stock_product(
 
 
 @pytest.fixture
-def products_list(category_id: UUID, test_price: Price) -> list[Product]:
+def products_list(category_id: UUID) -> list[Product]:
     """Create list of sample products."""
-    products = [
-        Product(
-            id=uuid4(),
-            name=f"Product {i}",
-            description=f"Description {i}",
-            price=Price.from_float(10.0 * (i + 1), "USD"),
-            category_id=category_id,
-            stock=10 * (i + 1),
-        )
-        for i in range(5)
-    ]
-    return products
+    return make_product_batch(5, category_id=category_id)
 
 
 # ============================================================================
 # Mock Repository Fixtures
 # ============================================================================
 
+def _make_fake_category_repo() -> SimpleNamespace:
+    """Build category repository stub."""
+    return make_fake_repo(
+        "get_by_id", "get_all", "get_tree", "get_tree_version", "get_children"
+    )
+
+
 @pytest.fixture
-def mock_product_repository():
+def mock_product_repository() -> SimpleNamespace:
     """Create mock product repository."""
-    mock = Mock(spec=IProductRepository)
+    return make_fake_product_repo()
 
-    # Configure async methods
-    mock.get_by_id = AsyncMock()
-    mock.get_all = AsyncMock()
-    mock.search = AsyncMock()
-    mock.count = AsyncMock()
 
-    return mock
+@pytest.fixture
+def mock_category_repository() -> SimpleNamespace:
+    """Create mock category repository."""
+    return _make_fake_category_repo()
 
 
 @pytest.fixture
-def mock_category_repository():
-    """Create mock category repository."""
-    mock = Mock(spec=ICategoryRepository)
+def product_service(
+    mock_product_repository: SimpleNamespace,
+) -> tuple[ProductService, SimpleNamespace]:
+    """Create product service wired to a fresh repository stub."""
+    return ProductService(mock_product_repository), mock_product_repository
 
-    # Configure async methods
-    mock.get_by_id = AsyncMock()
-    mock.get_all = AsyncMock()
-    mock.get_tree = AsyncMock()
-    mock.get_children = AsyncMock()
 
-    return mock
+@pytest.fixture
+def category_service(
+    mock_category_repository: SimpleNamespace,
+) -> tuple[CategoryService, SimpleNamespace]:
+    """Create category service wired to a fresh repository stub."""
+    return CategoryService(mock_category_repository), mock_category_repository
@@ -4,6 +4,8 @@ Fixtures for Catalog module tests.
 Provides reusable test data and mock objects.
 """
 
+from functools import lru_cache
+from typing import Any
 from uuid import UUID, uuid4
 from decimal import Decimal
 
@@ -25,25 +27,37 @@ def generate_product_id() -> UUID:
     return uuid4()
 
 
+@lru_cache(maxsize=None)
+def generate_product_ids(count: int) -> tuple[UUID, ...]:
+    """Generate distinct product IDs, reused across calls with the same count."""
+    return tuple(uuid4() for _ in range(count))
+
+
 # ============================================================================
 # Test Data Factories
 # ============================================================================
 
+# Immutable value objects share one instance per arguments; Price is built
+# fresh because it fills amount/cents lazily in its instance dict
+
 def create_test_price(amount: float = 29.99, currency: str = "USD") -> Price:
     """Create test price."""
     return Price.from_float(amount, currency)
 
 
+@lru_cache(maxsize=128)
 def create_test_product_name(name: str = "Test Product") -> ProductName:
     """Create test product name."""
     return ProductName(name)
 
 
+@lru_cache(maxsize=128)
 def create_test_description(text: str = "Test product description") -> Description:
     """Create test description."""
     return Description(text)
 
 
+@lru_cache(maxsize=128)
 def create_test_quantity(value: int = 50) -> Quantity:
     """Create test quantity."""
     return Quantity(value)
@@ -75,6 +89,52 @@ def create_test_product(
     )
 
 
+# Validated once at import; clones skip Product.__post_init__
+_TEMPLATE_PRODUCT = Product(
+    id=None,
+    name="Test Product",
+    description="Test description",
+    price=create_test_price(10.0),
+    category_id=None,
+    stock=10,
+)
+
+
+def clone_test_product(**overrides: Any) -> Product:
+    """
+    Copy the template product with overrides, without re-validating.
+
+    Overrides must already be valid; use create_test_product when the
+    test exercises Product validation itself.
+    """
+    return Product.from_trusted(**{**vars(_TEMPLATE_PRODUCT), **overrides})
+
+
+def make_product_batch(
+    n: int,
+    *,
+    category_id: UUID,
+    base_price: float = 10.0,
+) -> list[Product]:
+    """
+    Create n products priced and stocked in steps of 1..n.
+
+    IDs and prices come from cached factories, so repeated batches only
+    pay for the Product entities themselves.
+    """
+    return [
+        Product(
+            id=product_id,
+            name=f"Product {i}",
+            description=f"Description {i}",
+            price=create_test_price(base_price * (i + 1)),
+            category_id=category_id,
+            stock=10 * (i + 1),
+        )
+        for i, product_id in enumerate(generate_product_ids(n))
+    ]
+
+
 def create_category_with_children(
     num_children: int = 3,
 ) -> Category:
@@ -92,6 +152,12 @@ def create_category_with_children(
 # Test Data Constants
 # ============================================================================
 
+# Boundary-length strings for name/description limits, built once at import
+STR_255 = "A" * 255
+STR_256 = STR_255 + "A"
+STR_5000 = "A" * 5000
+STR_5001 = STR_5000 + "A"
+
 VALID_PRICES = [0.01, 9.99, 19.99, 99.99, 999.99, 9999.99]
 INVALID_PRICES = [0, -0.01, -1.99, -100]
 VALID_CURRENCIES = ["USD", "EUR", "GBP", "JPY", "CAD"]
@@ -101,33 +167,34 @@ VALID_PRODUCT_NAMES = [
     "Product A",
     "Super Product",
     "Premium Quality Item",
-    "A" * 255,  # Max length
+    STR_255,  # Max length
 ]
 INVALID_PRODUCT_NAMES = [
     "",  # Empty
     "   ",  # Whitespace only
-    "A" * 256,  # Too long
+    STR_256,  # Too long
 ]
 
 VALID_DESCRIPTIONS = [
     "Short description",
     "This is a detailed product description with multiple features",
-    "A" * 5000,  # Max length
+    STR_5000,  # Max length
 ]
 INVALID_DESCRIPTIONS = [
-    "A" * 5001,  # Too long
+    STR_5001,  # Too long
 ]
 
 VALID_STOCK_LEVELS = [0, 1, 10, 50, 100, 1000]
 INVALID_STOCK_LEVELS = [-1, -10, -100]
 
+# Fixed IDs: deterministic and free of work at import time
 CATEGORY_TEST_DATA = {
     "valid_category": {
         "name": "Electronics",
     },
     "category_with_parent": {
         "name": "Laptops",
-        "parent_id": uuid4(),
+        "parent_id": UUID(int=1),
     },
     "root_category": {
         "name": "Root",
@@ -8,28 +8,21 @@ import pytest
 from uuid import uuid4
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from modules.catalog.domain.entities import Category, Product
 from modules.catalog.infrastructure.repositories import (
     SQLAlchemyProductRepository,
     SQLAlchemyCategoryRepository,
 )
-from modules.catalog.infrastructure.orm import Base as CatalogBase
-from modules.catalog.domain.value_objects import Price
+from modules.catalog.infrastructure.orm import CategoryORM, ProductORM
 
 
 # ============================================================================
 # SQLAlchemyProductRepository Integration Tests
 # ============================================================================
 
+@pytest.mark.xdist_group("catalog-product")
 class TestSQLAlchemyProductRepository:
     """Test suite for SQLAlchemyProductRepository with database."""
 
-    @pytest.fixture(autouse=True)
-    async def setup_tables(self, async_engine):
-        """Setup database tables before each test."""
-        async with async_engine.begin() as conn:
-            await conn.run_sync(lambda _: CatalogBase.metadata.create_all(_))
-
     @pytest.fixture
     def product_repository(self, db_session: AsyncSession) -> SQLAlchemyProductRepository:
         """Create product repository instance."""
@@ -44,47 +37,33 @@ class TestSQLAlchemyProductRepository:
     # Create and Read Tests
     # ========================================================================
 
-    @pytest.mark.asyncio
     async def test_create_and_get_product(self, product_repository):
         """Test creating and retrieving product."""
-        product = Product(
-            id=None,
-            name="Laptop",
-            description="High-performance laptop",
-            price=Price.from_float(999.99, "USD"),
-            category_id=None,
-            stock=50,
-        )
-
         # Note: In real implementation, you'd have a save method
         # For now, we'll test get_by_id with None
         result = await product_repository.get_by_id(uuid4())
         assert result is None
 
-    @pytest.mark.asyncio
     async def test_get_product_not_found(self, product_repository):
         """Test retrieving non-existent product returns None."""
         result = await product_repository.get_by_id(uuid4())
 
         assert result is None
 
-    @pytest.mark.asyncio
     async def test_get_all_products_empty(self, product_repository):
         """Test getting all products when none exist."""
         products = await product_repository.get_all()
 
         assert products == []
 
-    @pytest.mark.asyncio
     async def test_get_all_products_with_limit(self, product_repository):
         """Test getting all products with limit."""
         # This test would require actual data insertion
         # which depends on repository implementation details
         products = await product_repository.get_all(limit=10, offset=0)
 
-        assert isinstance(products, list)
+        assert type(products) is list
 
-    @pytest.mark.asyncio
     async def test_get_all_products_with_filters(self, product_repository):
         """Test getting all products with various filters."""
         category_id = uuid4()
@@ -101,23 +80,20 @@ class TestSQLAlchemyProductRepository:
             offset=0,
         )
 
-        assert isinstance(products, list)
+        assert type(products) is list
 
-    @pytest.mark.asyncio
     async def test_search_products_empty_query(self, product_repository):
         """Test searching products with empty query."""
         products = await product_repository.search("", limit=10, offset=0)
 
-        assert isinstance(products, list)
+        assert type(products) is list
 
-    @pytest.mark.asyncio
     async def test_search_products_with_query(self, product_repository):
         """Test searching products with query."""
         products = await product_repository.search("laptop", limit=10, offset=0)
 
-        assert isinstance(products, list)
+        assert type(products) is list
 
-    @pytest.mark.asyncio
     async def test_count_products(self, product_repository):
         """Test counting products."""
         count = await product_repository.count()
@@ -125,7 +101,6 @@ class TestSQLAlchemyProductRepository:
         assert isinstance(count, int)
         assert count >= 0
 
-    @pytest.mark.asyncio
     async def test_count_products_with_filters(self, product_repository):
         """Test counting products with filters."""
         category_id = uuid4()
@@ -141,20 +116,115 @@ class TestSQLAlchemyProductRepository:
         assert isinstance(count, int)
         assert count >= 0
 
+    # ========================================================================
+    # List With Count Tests
+    # ========================================================================
+
+    @pytest.fixture
+    async def stored_products(self, db_session: AsyncSession) -> list[ProductORM]:
+        """Insert products with prices 10.00 .. 50.00 and stock 0 .. 4."""
+        orm_products = [
+            ProductORM(
+                id=uuid4(),
+                name=f"Product {i}",
+                description=f"Description {i}",
+                price=1000 * (i + 1),
+                currency="USD",
+                stock=i,
+            )
+            for i in range(5)
+        ]
+        db_session.add_all(orm_products)
+        await db_session.flush()
+        return orm_products
+
+    async def test_list_with_count_returns_page_and_total(
+        self, product_repository, stored_products
+    ):
+        """Test page is limited while total counts all matches."""
+        products, total = await product_repository.list_with_count(
+            limit=2, offset=0, order_by="price", order_dir="asc"
+        )
+
+        assert total == 5
+        assert [p.name for p in products] == ["Product 0", "Product 1"]
+
+    async def test_list_with_count_applies_filters_to_total(
+        self, product_repository, stored_products
+    ):
+        """Test filters narrow both the page and the total."""
+        products, total = await product_repository.list_with_count(
+            price_min=20.0, in_stock=True, limit=1
+        )
+
+        assert total == 4
+        assert len(products) == 1
+
+    async def test_list_with_count_offset_past_end_keeps_total(
+        self, product_repository, stored_products
+    ):
+        """Test empty page past the end still reports the total."""
+        products, total = await product_repository.list_with_count(limit=10, offset=10)
+
+        assert products == []
+        assert total == 5
+
+    async def test_get_all_after_keyset(self, product_repository, stored_products):
+        """Test keyset continues after the given sort key."""
+        third = stored_products[2]
+
+        products = await product_repository.get_all(
+            order_by="price", order_dir="asc", after=(third.price, third.id)
+        )
+
+        assert [p.name for p in products] == ["Product 3", "Product 4"]
+
+    async def test_get_all_after_keyset_descending(
+        self, product_repository, stored_products
+    ):
+        """Test keyset honours descending order."""
+        third = stored_products[2]
+
+        products = await product_repository.get_all(
+            order_by="name", order_dir="desc", after=(third.name, third.id)
+        )
+
+        assert [p.name for p in products] == ["Product 1", "Product 0"]
+
+    async def test_price_filter_rounds_to_cents(self, product_repository, db_session):
+        """Test float price bounds match the stored cents exactly."""
+        db_session.add(
+            ProductORM(
+                id=uuid4(),
+                name="Sticker",
+                description="Cheap",
+                price=29,
+                currency="USD",
+                stock=1,
+            )
+        )
+        await db_session.flush()
+
+        products = await product_repository.get_all(price_min=0.29, price_max=0.29)
+
+        assert [p.name for p in products] == ["Sticker"]
+
+    async def test_list_with_count_empty(self, product_repository):
+        """Test listing with count when no products exist."""
+        products, total = await product_repository.list_with_count()
+
+        assert products == []
+        assert total == 0
+
 
 # ============================================================================
 # SQLAlchemyCategoryRepository Integration Tests
 # ============================================================================
 
+@pytest.mark.xdist_group("catalog-category")
 class TestSQLAlchemyCategoryRepository:
     """Test suite for SQLAlchemyCategoryRepository with database."""
 
-    @pytest.fixture(autouse=True)
-    async def setup_tables(self, async_engine):
-        """Setup database tables before each test."""
-        async with async_engine.begin() as conn:
-            await conn.run_sync(lambda _: CatalogBase.metadata.create_all(_))
-
     @pytest.fixture
     def category_repository(self, db_session: AsyncSession) -> SQLAlchemyCategoryRepository:
         """Create category repository instance."""
@@ -164,44 +234,70 @@ class TestSQLAlchemyCategoryRepository:
     # Create and Read Tests
     # ========================================================================
 
-    @pytest.mark.asyncio
     async def test_get_category_not_found(self, category_repository):
         """Test retrieving non-existent category returns None."""
         result = await category_repository.get_by_id(uuid4())
 
         assert result is None
 
-    @pytest.mark.asyncio
     async def test_get_all_categories_empty(self, category_repository):
         """Test getting all categories when none exist."""
         categories = await category_repository.get_all()
 
         assert categories == []
 
-    @pytest.mark.asyncio
     async def test_get_all_categories_with_limit(self, category_repository):
         """Test getting all categories with limit."""
         categories = await category_repository.get_all(limit=10, offset=0)
 
-        assert isinstance(categories, list)
+        assert type(categories) is list
 
-    @pytest.mark.asyncio
     async def test_get_category_tree_empty(self, category_repository):
         """Test getting category tree when none exist."""
         categories = await category_repository.get_tree()
 
         assert categories == []
 
-    @pytest.mark.asyncio
     async def test_get_category_tree(self, category_repository):
         """Test getting category hierarchy tree."""
         categories = await category_repository.get_tree()
 
-        assert isinstance(categories, list)
+        assert type(categories) is list
+
+    async def test_get_category_tree_nested(self, category_repository, db_session):
+        """Test tree is assembled across several levels in name order."""
+        electronics_id, books_id = uuid4(), uuid4()
+        laptops_id, phones_id = uuid4(), uuid4()
+        db_session.add_all([
+            CategoryORM(id=electronics_id, name="Electronics"),
+            CategoryORM(id=books_id, name="Books"),
+            CategoryORM(id=phones_id, name="Phones", parent_id=electronics_id),
+            CategoryORM(id=laptops_id, name="Laptops", parent_id=electronics_id),
+            CategoryORM(id=uuid4(), name="Gaming Laptops", parent_id=laptops_id),
+        ])
+        await db_session.flush()
+
+        roots = await category_repository.get_tree()
+
+        assert [c.name for c in roots] == ["Books", "Electronics"]
+        electronics = roots[1]
+        assert [c.name for c in electronics.children] == ["Laptops", "Phones"]
+        assert [c.name for c in electronics.children[0].children] == ["Gaming Laptops"]
+        assert electronics.children[0].children[0].parent_id == laptops_id
 
-    @pytest.mark.asyncio
     async def test_get_children_empty(self, category_repository):
         """Test getting children for non-existent parent."""
         children = await category_repository.get_children(uuid4())
 
-        assert isinstance(children, list)
+        assert type(children) is list
+
+    async def test_get_tree_version_changes_on_insert(self, category_repository, db_session):
+        """Test tree version token changes when a category is added."""
+        before = await category_repository.get_tree_version()
+
+        db_session.add(CategoryORM(id=uuid4(), name="Electronics"))
+        await db_session.flush()
+        after = await category_repository.get_tree_version()
+
+        assert before != after
+        assert after == await category_repository.get_tree_version()
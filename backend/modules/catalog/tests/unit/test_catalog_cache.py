@@ -0,0 +1,73 @@
+"""
+Unit tests for Catalog caches.
+
+Tests TTLCache and the shared cache providers.
+"""
+
+from modules.catalog.infrastructure.cache import (
+    TTLCache,
+    clear_catalog_caches,
+    get_category_cache,
+    get_category_tree_cache,
+    get_product_cache,
+)
+
+
+# ============================================================================
+# TTLCache Unit Tests
+# ============================================================================
+
+class TestTTLCache:
+    """Test suite for TTLCache."""
+
+    def test_entry_expires_after_ttl(self):
+        """Test entries are dropped once their ttl elapses."""
+        now = [0.0]
+        cache = TTLCache(ttl=10.0, clock=lambda: now[0])
+        cache.set("key", "value")
+
+        now[0] = 9.0
+        assert cache.get("key") == "value"
+
+        now[0] = 10.0
+        assert cache.get("key") is None
+
+    def test_evicts_least_recently_used(self):
+        """Test the least recently used entry is evicted when full."""
+        cache = TTLCache(maxsize=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+
+        cache.set("c", 3)
+
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.get("c") == 3
+
+
+# ============================================================================
+# Shared Cache Provider Tests
+# ============================================================================
+
+class TestSharedCaches:
+    """Test suite for the shared cache providers."""
+
+    def test_providers_return_shared_instances(self):
+        """Test each provider hands out one instance per process."""
+        assert get_product_cache() is get_product_cache()
+        assert get_category_cache() is get_category_cache()
+        assert get_category_tree_cache() is get_category_tree_cache()
+        assert get_product_cache() is not get_category_cache()
+
+    def test_clear_catalog_caches_drops_all_entries(self):
+        """Test clearing empties every shared cache."""
+        get_product_cache().set("product", 1)
+        get_category_cache().set("category", 2)
+        get_category_tree_cache().set("v1", [])
+
+        clear_catalog_caches()
+
+        assert get_product_cache().get("product") is None
+        assert get_category_cache().get("category") is None
+        assert get_category_tree_cache().get("v1") is None
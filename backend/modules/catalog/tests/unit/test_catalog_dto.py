@@ -25,14 +25,14 @@ class TestProductDTO:
 
     def test_create_product_dto(self):
         """Test creating product DTO."""
-        product_id = str(uuid4())
-        category_id = str(uuid4())
+        product_id = uuid4()
+        category_id = uuid4()
 
         dto = ProductDTO(
             id=product_id,
             name="Laptop",
             description="High-performance laptop",
-            price=999.99,
+            price_cents=99999,
             currency="USD",
             category_id=category_id,
             stock=50,
@@ -46,6 +46,23 @@ class TestProductDTO:
         assert dto.stock == 50
         assert dto.is_available is True
 
+    def test_product_dto_uses_slots(self):
+        """Test product DTO has no per-instance __dict__."""
+        dto = ProductDTO(
+            id=uuid4(),
+            name="Laptop",
+            description="High-performance laptop",
+            price_cents=99999,
+            currency="USD",
+            category_id=None,
+            stock=50,
+            is_available=True,
+        )
+
+        assert not hasattr(dto, "__dict__")
+        with pytest.raises(AttributeError):
+            dto.created_at = None
+
 
 # ============================================================================
 # ProductListDTO Tests
@@ -58,12 +75,12 @@ class TestProductListDTO:
         """Test creating product list DTO."""
         items = [
             ProductDTO(
-                id=str(uuid4()),
+                id=uuid4(),
                 name=f"Product {i}",
                 description=f"Description {i}",
-                price=10.0 * (i + 1),
+                price_cents=1000 * (i + 1),
                 currency="USD",
-                category_id=str(uuid4()),
+                category_id=uuid4(),
                 stock=10 * (i + 1),
                 is_available=True,
             )
@@ -92,8 +109,8 @@ class TestCategoryDTO:
 
     def test_create_category_dto(self):
         """Test creating category DTO."""
-        category_id = str(uuid4())
-        parent_id = str(uuid4())
+        category_id = uuid4()
+        parent_id = uuid4()
 
         dto = CategoryDTO(
             id=category_id,
@@ -107,7 +124,7 @@ class TestCategoryDTO:
 
     def test_create_category_dto_without_parent(self):
         """Test creating category DTO without parent."""
-        category_id = str(uuid4())
+        category_id = uuid4()
 
         dto = CategoryDTO(
             id=category_id,
@@ -129,9 +146,9 @@ class TestCategoryTreeDTO:
 
     def test_create_category_tree_dto(self):
         """Test creating category tree DTO with children."""
-        parent_id = str(uuid4())
-        child_id1 = str(uuid4())
-        child_id2 = str(uuid4())
+        parent_id = uuid4()
+        child_id1 = uuid4()
+        child_id2 = uuid4()
 
         children = [
             CategoryTreeDTO(
@@ -163,9 +180,9 @@ class TestCategoryTreeDTO:
 
     def test_create_nested_category_tree(self):
         """Test creating nested category tree."""
-        root_id = str(uuid4())
-        child_id = str(uuid4())
-        grandchild_id = str(uuid4())
+        root_id = uuid4()
+        child_id = uuid4()
+        grandchild_id = uuid4()
 
         grandchild = CategoryTreeDTO(
             id=grandchild_id,
@@ -191,6 +208,17 @@ class TestCategoryTreeDTO:
         assert root.children[0].name == "Laptops"
         assert root.children[0].children[0].name == "Gaming Laptops"
 
+    def test_category_tree_dto_uses_slots(self):
+        """Test category tree DTO has no per-instance __dict__."""
+        dto = CategoryTreeDTO(
+            id=uuid4(),
+            name="Electronics",
+            parent_id=None,
+            children=[],
+        )
+
+        assert not hasattr(dto, "__dict__")
+
 
 # ============================================================================
 # ProductFilterDTO Tests
@@ -239,86 +267,55 @@ class TestProductFilterDTO:
         assert dto.limit == 20
         assert dto.offset == 40
 
-    def test_validate_limit_too_low_gets_default(self):
-        """Test limit below minimum gets set to default."""
-        dto = ProductFilterDTO(limit=0)
-
-        assert dto.limit == 100
-
-    def test_validate_limit_negative_gets_default(self):
-        """Test negative limit gets set to default."""
-        dto = ProductFilterDTO(limit=-10)
-
-        assert dto.limit == 100
-
-    def test_validate_limit_too_high_gets_capped(self):
-        """Test limit above maximum gets capped."""
-        dto = ProductFilterDTO(limit=2000)
-
-        assert dto.limit == 1000
-
-    def test_validate_offset_negative_gets_zero(self):
-        """Test negative offset gets set to zero."""
-        dto = ProductFilterDTO(offset=-10)
-
-        assert dto.offset == 0
-
-    def test_validate_invalid_order_by_gets_default(self):
-        """Test invalid order_by gets set to default."""
-        dto = ProductFilterDTO(order_by="invalid_field")
-
-        assert dto.order_by == "created_at"
-
-    def test_validate_valid_order_by_fields(self):
-        """Test valid order_by fields are accepted."""
-        for field in ["name", "price", "created_at"]:
-            dto = ProductFilterDTO(order_by=field)
-            assert dto.order_by == field
-
-    def test_validate_invalid_order_dir_gets_default(self):
-        """Test invalid order_dir gets set to default."""
-        dto = ProductFilterDTO(order_dir="invalid")
-
-        assert dto.order_dir == "desc"
-
-    def test_validate_valid_order_dir_values(self):
-        """Test valid order_dir values are accepted."""
-        for direction in ["asc", "desc"]:
-            dto = ProductFilterDTO(order_dir=direction)
-            assert dto.order_dir == direction
-
-    def test_validate_negative_price_min_gets_none(self):
-        """Test negative price_min gets set to None."""
-        dto = ProductFilterDTO(price_min=-10.0)
-
-        assert dto.price_min is None
-
-    def test_validate_negative_price_max_gets_none(self):
-        """Test negative price_max gets set to None."""
-        dto = ProductFilterDTO(price_max=-10.0)
-
-        assert dto.price_max is None
-
-    def test_validate_swapped_price_range_gets_corrected(self):
-        """Test price range with min > max gets swapped."""
-        dto = ProductFilterDTO(price_min=1000.0, price_max=100.0)
-
-        assert dto.price_min == 100.0
-        assert dto.price_max == 1000.0
-
-    def test_validate_equal_price_range_unchanged(self):
-        """Test equal price range remains unchanged."""
-        dto = ProductFilterDTO(price_min=100.0, price_max=100.0)
-
-        assert dto.price_min == 100.0
-        assert dto.price_max == 100.0
-
-    def test_validate_partial_price_range_unchanged(self):
-        """Test partial price range (only min or only max) remains unchanged."""
-        dto1 = ProductFilterDTO(price_min=100.0)
-        assert dto1.price_min == 100.0
-        assert dto1.price_max is None
-
-        dto2 = ProductFilterDTO(price_max=500.0)
-        assert dto2.price_min is None
-        assert dto2.price_max == 500.0
+    @pytest.mark.parametrize(
+        "kwargs, attr, expected",
+        [
+            pytest.param({"limit": 0}, "limit", 100, id="limit-too-low"),
+            pytest.param({"limit": -10}, "limit", 100, id="limit-negative"),
+            pytest.param({"limit": 2000}, "limit", 1000, id="limit-too-high"),
+            pytest.param({"offset": -10}, "offset", 0, id="offset-negative"),
+            pytest.param(
+                {"order_by": "invalid_field"}, "order_by", "created_at", id="order-by-invalid"
+            ),
+            pytest.param({"order_dir": "invalid"}, "order_dir", "desc", id="order-dir-invalid"),
+            pytest.param({"price_min": -10.0}, "price_min", None, id="price-min-negative"),
+            pytest.param({"price_max": -10.0}, "price_max", None, id="price-max-negative"),
+        ],
+    )
+    def test_clamp_single_field(self, kwargs, attr, expected):
+        """Test out-of-range filter values are clamped or reset to defaults."""
+        dto = ProductFilterDTO(**kwargs)
+
+        assert getattr(dto, attr) == expected
+
+    @pytest.mark.parametrize(
+        "price_min, price_max, exp_min, exp_max",
+        [
+            pytest.param(1000.0, 100.0, 100.0, 1000.0, id="swapped"),
+            pytest.param(100.0, 100.0, 100.0, 100.0, id="equal"),
+            pytest.param(100.0, None, 100.0, None, id="min-only"),
+            pytest.param(None, 500.0, None, 500.0, id="max-only"),
+        ],
+    )
+    def test_price_range_normalization(self, price_min, price_max, exp_min, exp_max):
+        """Test price range is swapped when inverted and kept otherwise."""
+        dto = ProductFilterDTO(price_min=price_min, price_max=price_max)
+
+        assert dto.price_min == exp_min
+        assert dto.price_max == exp_max
+
+    @pytest.mark.parametrize(
+        "attr, value",
+        [
+            pytest.param("order_by", "name", id="order-by-name"),
+            pytest.param("order_by", "price", id="order-by-price"),
+            pytest.param("order_by", "created_at", id="order-by-created-at"),
+            pytest.param("order_dir", "asc", id="order-dir-asc"),
+            pytest.param("order_dir", "desc", id="order-dir-desc"),
+        ],
+    )
+    def test_order_field_accepted(self, attr, value):
+        """Test valid ordering values are accepted unchanged."""
+        dto = ProductFilterDTO(**{attr: value})
+
+        assert getattr(dto, attr) == value
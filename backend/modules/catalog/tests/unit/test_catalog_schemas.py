@@ -0,0 +1,123 @@
+"""
+Unit tests for Catalog API schemas.
+
+Tests response mapping from DTOs to API schemas.
+"""
+
+import json
+from uuid import uuid4
+
+from modules.catalog.application.dto import CategoryDTO, CategoryTreeDTO, ProductDTO
+from modules.catalog.presentation.api.routes import (
+    _categories_to_tree_dicts,
+    _category_to_response,
+    _product_to_response,
+)
+from modules.catalog.presentation.api.schemas import (
+    CategoryResponse,
+    CategoryTreeResponse,
+    ProductListResponse,
+    ProductResponse,
+    dump_product_list,
+)
+
+
+# ============================================================================
+# Response Mapping Tests
+# ============================================================================
+
+class TestResponseMapping:
+    """Test suite for trusted DTO -> response construction."""
+
+    def test_product_response_matches_validated(self):
+        """Test unvalidated product response equals the validating path."""
+        dto = ProductDTO(
+            id=uuid4(),
+            name="Laptop",
+            description="High-performance laptop",
+            price_cents=99999,
+            currency="USD",
+            category_id=uuid4(),
+            stock=50,
+            is_available=True,
+        )
+
+        response = _product_to_response(dto)
+        validated = ProductResponse.model_validate(response.model_dump())
+
+        assert response == validated
+        assert response.model_dump_json() == validated.model_dump_json()
+        assert response.model_dump()["price"] == 999.99
+
+    def test_category_response_matches_validated(self):
+        """Test unvalidated category response equals the validating path."""
+        dto = CategoryDTO(id=uuid4(), name="Electronics", parent_id=None)
+
+        response = _category_to_response(dto)
+
+        assert response == CategoryResponse.model_validate(response.model_dump())
+
+    def test_category_tree_dicts_match_validated(self):
+        """Test tree dicts keep nesting and match the validated schema."""
+        root_id, child_id = uuid4(), uuid4()
+        dtos = [
+            CategoryTreeDTO(root_id, "Electronics", None, [
+                CategoryTreeDTO(child_id, "Laptops", root_id, [
+                    CategoryTreeDTO(uuid4(), "Gaming", child_id, []),
+                ]),
+                CategoryTreeDTO(uuid4(), "Phones", root_id, []),
+            ]),
+            CategoryTreeDTO(uuid4(), "Books", None, []),
+        ]
+
+        tree = _categories_to_tree_dicts(dtos)
+        validated = [
+            CategoryTreeResponse.model_validate(node).model_dump() for node in tree
+        ]
+
+        assert tree == validated
+        assert [c["name"] for c in tree[0]["children"]] == ["Laptops", "Phones"]
+        assert tree[0]["children"][0]["children"][0]["name"] == "Gaming"
+
+    def test_product_list_response_keeps_item_instances(self):
+        """Test list response does not revalidate or copy item models."""
+        item = _product_to_response(
+            ProductDTO(
+                id=uuid4(),
+                name="Laptop",
+                description="High-performance laptop",
+                price_cents=99999,
+                currency="USD",
+                category_id=None,
+                stock=1,
+                is_available=True,
+            )
+        )
+
+        response = ProductListResponse(items=[item], total=1, limit=10, offset=0)
+
+        assert response.items[0] is item
+
+
+# ============================================================================
+# List Serializer Tests
+# ============================================================================
+
+class TestListSerializers:
+    """Test suite for module-level list serializers."""
+
+    def test_dump_product_list(self):
+        """Test product list dumps to a JSON array of response objects."""
+        response = ProductResponse(
+            id=uuid4(),
+            name="Laptop",
+            description="High-performance laptop",
+            price_cents=99999,
+            stock=0,
+            is_available=False,
+        )
+
+        assert json.loads(dump_product_list([response])) == [
+            response.model_dump(mode="json")
+        ]
+        assert dump_product_list([]) == b"[]"
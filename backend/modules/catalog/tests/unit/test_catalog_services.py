@@ -4,16 +4,37 @@ Unit tests for Catalog application services.
 Tests ProductService and CategoryService with mocked dependencies.
 """
 
+import base64
+import json
 import pytest
-from uuid import uuid4
+from uuid import UUID
 from unittest.mock import Mock
 
-from modules.catalog.application.services import ProductService, CategoryService
+from modules.catalog.application.services import (
+    CategoryService,
+    ProductService,
+    _categories_to_tree_dtos,
+    _category_to_dto,
+    _product_to_dto,
+)
 from modules.catalog.application.dto import ProductFilterDTO, ProductListDTO
 from modules.catalog.domain.entities import Product, Category
-from modules.catalog.domain.exceptions import ProductNotFoundException, CategoryNotFoundException
+from modules.catalog.domain.exceptions import (
+    CategoryNotFoundException,
+    InvalidCursorError,
+    ProductNotFoundException,
+)
 from modules.catalog.domain.value_objects import Price
-from modules.catalog.tests.fixtures import create_test_product
+from modules.catalog.infrastructure.cache import CategoryTreeCache, TTLCache
+from modules.catalog.tests.fixtures import (
+    clone_test_product,
+    create_test_price,
+    create_test_product,
+)
+
+
+# Deterministic ids for tests that only need distinct UUIDs
+SENTINEL_IDS = [UUID(int=i) for i in range(1, 32)]
 
 
 # ============================================================================
@@ -23,10 +44,10 @@ from modules.catalog.tests.fixtures import create_test_product
 class TestProductService:
     """Test suite for ProductService."""
 
-    @pytest.mark.asyncio
-    async def test_get_product_success(self, mock_product_repository):
+    async def test_get_product_success(self, product_service):
         """Test successfully getting product by ID."""
-        product_id = uuid4()
+        service, mock_product_repository = product_service
+        product_id = SENTINEL_IDS[0]
         product = create_test_product(
             name="Laptop",
             description="High-performance laptop",
@@ -35,41 +56,57 @@ class TestProductService:
         )
         product.id = product_id
 
-        mock_product_repository.get_by_id.return_value = product
+        mock_product_repository.returns["get_by_id"] = product
 
-        service = ProductService(mock_product_repository)
         product_dto = await service.get_product(product_id)
 
-        mock_product_repository.get_by_id.assert_called_once_with(product_id)
-        assert product_dto.id == str(product_id)
+        assert mock_product_repository.calls["get_by_id"] == [((product_id,), {})]
+        assert product_dto.id == product_id
         assert product_dto.name == "Laptop"
         assert product_dto.price == 999.99
 
-    @pytest.mark.asyncio
-    async def test_get_product_not_found_raises_error(self, mock_product_repository):
+    async def test_get_product_not_found_raises_error(self, product_service):
         """Test getting non-existent product raises error."""
-        product_id = uuid4()
+        service, mock_product_repository = product_service
+        product_id = SENTINEL_IDS[0]
 
-        mock_product_repository.get_by_id.return_value = None
-
-        service = ProductService(mock_product_repository)
+        mock_product_repository.returns["get_by_id"] = None
 
         with pytest.raises(ProductNotFoundException):
             await service.get_product(product_id)
 
-    @pytest.mark.asyncio
-    async def test_list_products_with_filters(self, mock_product_repository):
+    async def test_get_product_uses_cache(self, mock_product_repository):
+        """Test cached product is served without hitting the repository."""
+        product_id = SENTINEL_IDS[0]
+        product = create_test_product()
+        product.id = product_id
+        mock_product_repository.returns["get_by_id"] = product
+        cache = TTLCache()
+
+        first = await ProductService(
+            mock_product_repository, product_cache=cache
+        ).get_product(product_id)
+        second = await ProductService(
+            mock_product_repository, product_cache=cache
+        ).get_product(product_id)
+
+        assert second is first
+        assert mock_product_repository.calls["get_by_id"] == [((product_id,), {})]
+
+    async def test_list_products_with_filters(self, product_service):
         """Test listing products with filters."""
+        service, mock_product_repository = product_service
         # Create mock products
         products = [
-            create_test_product(name=f"Product {i}", price=10.0 * (i + 1), stock=10 * (i + 1))
+            clone_test_product(
+                name=f"Product {i}", price=create_test_price(10.0 * (i + 1)), stock=10 * (i + 1)
+            )
             for i in range(3)
         ]
         for i, p in enumerate(products):
-            p.id = uuid4()
+            p.id = SENTINEL_IDS[i]
 
-        mock_product_repository.get_all.return_value = products
-        mock_product_repository.count.return_value = 3
+        mock_product_repository.returns["list_with_count"] = (products, 3)
 
         filters = ProductFilterDTO(
             price_min=10.0,
@@ -79,66 +116,109 @@ class TestProductService:
             offset=0,
         )
 
-        service = ProductService(mock_product_repository)
         result = await service.list_products(filters)
 
         assert len(result.items) == 3
         assert result.total == 3
         assert result.limit == 10
         assert result.offset == 0
-        mock_product_repository.get_all.assert_called_once()
-        mock_product_repository.count.assert_called_once()
+        assert len(mock_product_repository.calls["list_with_count"]) == 1
+        assert mock_product_repository.calls["get_all"] == []
+        assert mock_product_repository.calls["count"] == []
 
-    @pytest.mark.asyncio
-    async def test_search_products_valid_query(self, mock_product_repository):
+    async def test_list_products_cursor_continues_with_keyset(self, product_service):
+        """Test next_cursor from a full page drives a keyset query."""
+        service, mock_product_repository = product_service
+        products = [
+            clone_test_product(price=create_test_price(10.0 * (i + 1))) for i in range(2)
+        ]
+        for i, p in enumerate(products):
+            p.id = SENTINEL_IDS[i]
+        mock_product_repository.returns["list_with_count"] = (products, 5)
+        mock_product_repository.returns["get_all"] = []
+
+        first = await service.list_products(
+            ProductFilterDTO(order_by="price", order_dir="asc", limit=2)
+        )
+        second = await service.list_products(
+            ProductFilterDTO(
+                order_by="price", order_dir="asc", limit=2, cursor=first.next_cursor
+            )
+        )
+
+        assert first.next_cursor is not None
+        _, kwargs = mock_product_repository.calls["get_all"][-1]
+        assert kwargs["after"] == (2000, products[-1].id)
+        assert second.total is None
+        assert second.next_cursor is None
+
+    @pytest.mark.parametrize(
+        "cursor",
+        [
+            pytest.param("not-a-cursor", id="not-base64-json"),
+            pytest.param(["created_at", "desc", "2024-01-01T00:00:00", 5], id="non-string-id"),
+            pytest.param(["created_at", "desc", "2024-01-01T00:00:00"], id="too-short"),
+            pytest.param({"order_by": "created_at"}, id="not-a-list"),
+            pytest.param(["price", "asc", 1000, str(SENTINEL_IDS[0])], id="other-ordering"),
+            pytest.param(["created_at", "desc", "yesterday", str(SENTINEL_IDS[0])], id="bad-date"),
+            pytest.param(["created_at", "desc", "2024-01-01T00:00:00", "nope"], id="bad-uuid"),
+        ],
+    )
+    async def test_list_products_invalid_cursor_raises_error(self, product_service, cursor):
+        """Test malformed or stale cursor is rejected instead of restarting at page 1."""
+        service, mock_product_repository = product_service
+        if not isinstance(cursor, str):
+            cursor = base64.urlsafe_b64encode(json.dumps(cursor).encode()).decode()
+
+        with pytest.raises(InvalidCursorError):
+            await service.list_products(ProductFilterDTO(cursor=cursor))
+
+        assert mock_product_repository.calls["list_with_count"] == []
+        assert mock_product_repository.calls["get_all"] == []
+
+    async def test_search_products_valid_query(self, product_service):
         """Test searching products with valid query."""
+        service, mock_product_repository = product_service
         products = [
-            create_test_product(name="Laptop", price=999.99, stock=5),
-            create_test_product(name="Laptop Case", price=29.99, stock=20),
+            clone_test_product(name="Laptop", price=create_test_price(999.99), stock=5),
+            clone_test_product(name="Laptop Case", price=create_test_price(29.99), stock=20),
         ]
-        for p in products:
-            p.id = uuid4()
+        for i, p in enumerate(products):
+            p.id = SENTINEL_IDS[i]
 
-        mock_product_repository.search.return_value = products
+        mock_product_repository.returns["search"] = products
 
-        service = ProductService(mock_product_repository)
         result = await service.search_products("laptop", limit=10, offset=0)
 
         assert len(result) == 2
-        mock_product_repository.search.assert_called_once_with(query="laptop", limit=10, offset=0)
-
-    @pytest.mark.asyncio
-    async def test_search_products_short_query_returns_empty(self, mock_product_repository):
-        """Test searching with short query returns empty list."""
-        service = ProductService(mock_product_repository)
-        result = await service.search_products("a", limit=10, offset=0)
-
-        assert result == []
-        mock_product_repository.search.assert_not_called()
-
-    @pytest.mark.asyncio
-    async def test_search_products_empty_query_returns_empty(self, mock_product_repository):
-        """Test searching with empty query returns empty list."""
-        service = ProductService(mock_product_repository)
-        result = await service.search_products("", limit=10, offset=0)
-
-        assert result == []
-        mock_product_repository.search.assert_not_called()
+        assert mock_product_repository.calls["search"] == [
+            ((), {"query": "laptop", "limit": 10, "offset": 0})
+        ]
 
-    @pytest.mark.asyncio
-    async def test_search_products_whitespace_query_returns_empty(self, mock_product_repository):
-        """Test searching with whitespace query returns empty list."""
-        service = ProductService(mock_product_repository)
-        result = await service.search_products("   ", limit=10, offset=0)
+    @pytest.mark.parametrize(
+        "query",
+        [
+            pytest.param("a", id="short"),
+            pytest.param("", id="empty"),
+            pytest.param("   ", id="whitespace"),
+            pytest.param(" b ", id="short-padded"),
+            pytest.param("\t", id="tab"),
+        ],
+    )
+    async def test_search_products_short_or_empty_query_returns_empty(
+        self, product_service, query
+    ):
+        """Test searching with a query under two non-blank chars returns empty list."""
+        service, mock_product_repository = product_service
+        result = await service.search_products(query, limit=10, offset=0)
 
         assert result == []
-        mock_product_repository.search.assert_not_called()
+        assert mock_product_repository.calls["search"] == []
 
-    @pytest.mark.asyncio
-    async def test_to_dto_conversion(self, mock_product_repository):
+    def test_to_dto_conversion(self):
         """Test Product to DTO conversion."""
-        product_id = uuid4()
-        category_id = uuid4()
+        product_id = SENTINEL_IDS[0]
+        category_id = SENTINEL_IDS[1]
 
         product = Product(
             id=product_id,
@@ -149,32 +229,20 @@ class TestProductService:
             stock=50,
         )
 
-        mock_product_repository.get_by_id.return_value = product
+        product_dto = _product_to_dto(product)
 
-        service = ProductService(mock_product_repository)
-        product_dto = await service.get_product(product_id)
-
-        assert product_dto.id == str(product_id)
+        assert product_dto.id == product_id
         assert product_dto.name == "Test Laptop"
         assert product_dto.description == "Test description"
         assert product_dto.price == 999.99
         assert product_dto.currency == "USD"
-        assert product_dto.category_id == str(category_id)
+        assert product_dto.category_id == category_id
         assert product_dto.stock == 50
         assert product_dto.is_available is True
 
-    @pytest.mark.asyncio
-    async def test_to_dto_out_of_stock_product(self, mock_product_repository):
+    def test_to_dto_out_of_stock_product(self, out_of_stock_product):
         """Test DTO conversion for out of stock product."""
-        product_id = uuid4()
-
-        product = create_test_product(stock=0)
-        product.id = product_id
-
-        mock_product_repository.get_by_id.return_value = product
-
-        service = ProductService(mock_product_repository)
-        product_dto = await service.get_product(product_id)
+        product_dto = _product_to_dto(out_of_stock_product)
 
         assert product_dto.stock == 0
         assert product_dto.is_available is False
@@ -187,67 +255,58 @@ class TestProductService:
 class TestCategoryService:
     """Test suite for CategoryService."""
 
-    @pytest.mark.asyncio
-    async def test_get_category_success(self, mock_category_repository):
+    async def test_get_category_success(self, category_service):
         """Test successfully getting category by ID."""
-        category_id = uuid4()
+        service, mock_category_repository = category_service
+        category_id = SENTINEL_IDS[0]
         category = Category(id=category_id, name="Electronics")
 
-        mock_category_repository.get_by_id.return_value = category
+        mock_category_repository.returns["get_by_id"] = category
 
-        service = CategoryService(mock_category_repository)
         category_dto = await service.get_category(category_id)
 
-        mock_category_repository.get_by_id.assert_called_once_with(category_id)
-        assert category_dto.id == str(category_id)
+        assert mock_category_repository.calls["get_by_id"] == [((category_id,), {})]
+        assert category_dto.id == category_id
         assert category_dto.name == "Electronics"
 
-    @pytest.mark.asyncio
-    async def test_get_category_not_found_raises_error(self, mock_category_repository):
+    async def test_get_category_not_found_raises_error(self, category_service):
         """Test getting non-existent category raises error."""
-        category_id = uuid4()
+        service, mock_category_repository = category_service
+        category_id = SENTINEL_IDS[0]
 
-        mock_category_repository.get_by_id.return_value = None
-
-        service = CategoryService(mock_category_repository)
+        mock_category_repository.returns["get_by_id"] = None
 
         with pytest.raises(CategoryNotFoundException):
             await service.get_category(category_id)
 
-    @pytest.mark.asyncio
-    async def test_list_categories(self, mock_category_repository):
+    async def test_list_categories(self, category_service):
         """Test listing all categories."""
+        service, mock_category_repository = category_service
         categories = [
-            Category(id=uuid4(), name="Electronics"),
-            Category(id=uuid4(), name="Clothing"),
-            Category(id=uuid4(), name="Books"),
+            Category(id=SENTINEL_IDS[0], name="Electronics"),
+            Category(id=SENTINEL_IDS[1], name="Clothing"),
+            Category(id=SENTINEL_IDS[2], name="Books"),
         ]
 
-        mock_category_repository.get_all.return_value = categories
+        mock_category_repository.returns["get_all"] = categories
 
-        service = CategoryService(mock_category_repository)
         result = await service.list_categories(limit=10, offset=0)
 
         assert len(result) == 3
         assert result[0].name == "Electronics"
         assert result[1].name == "Clothing"
         assert result[2].name == "Books"
-        mock_category_repository.get_all.assert_called_once_with(limit=10, offset=0)
+        assert mock_category_repository.calls["get_all"] == [
+            ((), {"limit": 10, "offset": 0})
+        ]
 
-    @pytest.mark.asyncio
-    async def test_get_category_tree(self, mock_category_repository):
+    async def test_get_category_tree(self, category_service, electronics_tree):
         """Test getting category hierarchy tree."""
-        # Create category tree: Electronics -> Laptops, Phones
-        electronics = Category(id=uuid4(), name="Electronics")
-        laptops = Category(id=uuid4(), name="Laptops", parent_id=electronics.id)
-        phones = Category(id=uuid4(), name="Phones", parent_id=electronics.id)
+        service, mock_category_repository = category_service
+        electronics, _, _ = electronics_tree
 
-        electronics.add_child(laptops)
-        electronics.add_child(phones)
-
-        mock_category_repository.get_tree.return_value = [electronics]
+        mock_category_repository.returns["get_tree"] = [electronics]
 
-        service = CategoryService(mock_category_repository)
         result = await service.get_category_tree()
 
         assert len(result) == 1
@@ -256,42 +315,92 @@ class TestCategoryService:
         assert result[0].children[0].name == "Laptops"
         assert result[0].children[1].name == "Phones"
 
-    @pytest.mark.asyncio
-    async def test_to_dto_conversion(self, mock_category_repository):
+    def test_to_dto_conversion(self):
         """Test Category to DTO conversion."""
-        category_id = uuid4()
-        parent_id = uuid4()
+        category_id = SENTINEL_IDS[0]
+        parent_id = SENTINEL_IDS[1]
 
         category = Category(id=category_id, name="Laptops", parent_id=parent_id)
 
-        mock_category_repository.get_by_id.return_value = category
-
-        service = CategoryService(mock_category_repository)
-        category_dto = await service.get_category(category_id)
+        category_dto = _category_to_dto(category)
 
-        assert category_dto.id == str(category_id)
+        assert category_dto.id == category_id
         assert category_dto.name == "Laptops"
-        assert category_dto.parent_id == str(parent_id)
+        assert category_dto.parent_id == parent_id
 
-    @pytest.mark.asyncio
-    async def test_to_tree_dto_conversion(self, mock_category_repository):
+    def test_to_tree_dto_conversion(self, electronics_tree):
         """Test Category to tree DTO conversion with children."""
-        parent_id = uuid4()
-        child_id = uuid4()
+        electronics, laptops, _ = electronics_tree
 
-        parent = Category(id=parent_id, name="Electronics")
-        child = Category(id=child_id, name="Laptops", parent_id=parent_id)
+        result = _categories_to_tree_dtos([electronics])
 
-        parent.add_child(child)
+        assert result[0].id == electronics.id
+        assert result[0].name == "Electronics"
+        assert result[0].parent_id is None
+        assert result[0].children[0].id == laptops.id
+        assert result[0].children[0].name == "Laptops"
+        assert result[0].children[0].parent_id == electronics.id
 
-        mock_category_repository.get_tree.return_value = [parent]
+    async def test_get_category_tree_preserves_nesting_and_order(self, category_service):
+        """Test tree conversion keeps nested levels and sibling order."""
+        service, mock_category_repository = category_service
+        electronics = Category(id=SENTINEL_IDS[0], name="Electronics")
+        books = Category(id=SENTINEL_IDS[1], name="Books")
+        laptops = Category(id=SENTINEL_IDS[2], name="Laptops")
+        gaming = Category(id=SENTINEL_IDS[3], name="Gaming Laptops")
+        phones = Category(id=SENTINEL_IDS[4], name="Phones")
+
+        electronics.add_child(laptops)
+        electronics.add_child(phones)
+        laptops.add_child(gaming)
+
+        mock_category_repository.returns["get_tree"] = [electronics, books]
 
-        service = CategoryService(mock_category_repository)
         result = await service.get_category_tree()
 
-        assert result[0].id == str(parent_id)
-        assert result[0].name == "Electronics"
-        assert len(result[0].children) == 1
-        assert result[0].children[0].id == str(child_id)
-        assert result[0].children[0].name == "Laptops"
-        assert result[0].children[0].parent_id == str(parent_id)
+        assert [c.name for c in result] == ["Electronics", "Books"]
+        assert [c.name for c in result[0].children] == ["Laptops", "Phones"]
+        assert result[0].children[0].children[0].name == "Gaming Laptops"
+        assert result[0].children[0].children[0].parent_id == laptops.id
+        assert result[1].children == []
+
+    async def test_get_category_tree_uses_cache_for_same_version(
+        self, mock_category_repository
+    ):
+        """Test cached tree is reused while repository version is unchanged."""
+        mock_category_repository.returns["get_tree"] = [
+            Category(id=SENTINEL_IDS[0], name="Electronics")
+        ]
+        mock_category_repository.returns["get_tree_version"] = (1, None)
+        cache = CategoryTreeCache()
+
+        first = await CategoryService(
+            mock_category_repository, tree_cache=cache
+        ).get_category_tree()
+        second = await CategoryService(
+            mock_category_repository, tree_cache=cache
+        ).get_category_tree()
+
+        assert second is first
+        assert len(mock_category_repository.calls["get_tree"]) == 1
+
+    async def test_get_category_tree_rebuilds_on_version_change(
+        self, mock_category_repository
+    ):
+        """Test tree is rebuilt when repository version changes."""
+        mock_category_repository.returns["get_tree"] = [
+            Category(id=SENTINEL_IDS[0], name="Electronics")
+        ]
+        mock_category_repository.returns["get_tree_version"] = (1, None)
+        cache = CategoryTreeCache()
+        service = CategoryService(mock_category_repository, tree_cache=cache)
+
+        await service.get_category_tree()
+        mock_category_repository.returns["get_tree"] = [
+            Category(id=SENTINEL_IDS[1], name="Books")
+        ]
+        mock_category_repository.returns["get_tree_version"] = (2, None)
+        result = await service.get_category_tree()
+
+        assert result[0].name == "Books"
+        assert len(mock_category_repository.calls["get_tree"]) == 2
@@ -4,7 +4,9 @@ Unit tests for Catalog value objects.
 Tests Price, Money, ProductName, Description, and Quantity value objects.
 """
 
+import operator
 import pytest
+from dataclasses import FrozenInstanceError
 from decimal import Decimal
 
 from modules.catalog.domain.value_objects import (
@@ -14,6 +16,17 @@ from modules.catalog.domain.value_objects import (
     Description,
     Quantity,
 )
+from modules.catalog.tests.fixtures import STR_255, STR_256, STR_5000, STR_5001
+
+
+# Decimal amounts shared across tests, parsed once per session
+D_NEG_10_00 = Decimal("-10.00")
+D_0_00 = Decimal("0.00")
+D_10_00 = Decimal("10.00")
+D_20_00 = Decimal("20.00")
+D_29_99 = Decimal("29.99")
+D_99_99 = Decimal("99.99")
+D_100_50 = Decimal("100.50")
 
 
 # ============================================================================
@@ -23,52 +36,32 @@ from modules.catalog.domain.value_objects import (
 class TestMoney:
     """Test suite for Money value object."""
 
-    def test_create_valid_money(self):
-        """Test creating money with valid amount and currency."""
-        money = Money(amount=Decimal("100.50"), currency="USD")
-
-        assert money.amount == Decimal("100.50")
-        assert money.currency == "USD"
-
     def test_create_money_with_default_currency(self):
         """Test creating money defaults to USD."""
-        money = Money(amount=Decimal("50.00"))
+        money = Money(amount=D_10_00)
 
         assert money.currency == "USD"
 
     def test_create_money_with_negative_amount_raises_error(self):
         """Test creating money with negative amount raises error."""
         with pytest.raises(ValueError, match="Amount cannot be negative"):
-            Money(amount=Decimal("-10.00"), currency="USD")
+            Money(amount=D_NEG_10_00, currency="USD")
 
     def test_create_money_with_zero_amount(self):
         """Test creating money with zero amount succeeds."""
-        money = Money(amount=Decimal("0.00"), currency="USD")
+        money = Money(amount=D_0_00, currency="USD")
 
-        assert money.amount == Decimal("0.00")
+        assert money.amount == D_0_00
 
-    def test_create_money_with_invalid_currency_raises_error(self):
+    @pytest.mark.parametrize("currency", ["US", ""], ids=["too-short", "empty"])
+    def test_create_money_with_invalid_currency_raises_error(self, currency):
         """Test creating money with invalid currency raises error."""
         with pytest.raises(ValueError, match="Currency must be a valid"):
-            Money(amount=Decimal("10.00"), currency="US")
-
-    def test_create_money_with_empty_currency_raises_error(self):
-        """Test creating money with empty currency raises error."""
-        with pytest.raises(ValueError, match="Currency must be a valid"):
-            Money(amount=Decimal("10.00"), currency="")
+            Money(amount=D_10_00, currency=currency)
 
-    def test_money_string_representation(self):
+    def test_money_string_representation(self, usd_money):
         """Test string representation of Money."""
-        money = Money(amount=Decimal("99.99"), currency="USD")
-
-        assert str(money) == "99.99 USD"
-
-    def test_money_is_immutable(self):
-        """Test that Money is frozen/immutable."""
-        money = Money(amount=Decimal("10.00"), currency="USD")
-
-        with pytest.raises(Exception):  # FrozenInstanceError
-            money.amount = Decimal("20.00")
+        assert str(usd_money) == "100.50 USD"
 
 
 # ============================================================================
@@ -78,46 +71,84 @@ class TestMoney:
 class TestPrice:
     """Test suite for Price value object."""
 
-    def test_create_valid_price(self):
-        """Test creating price with valid amount."""
-        price = Price(amount=Decimal("29.99"), currency="USD")
-
-        assert price.amount == Decimal("29.99")
-        assert price.currency == "USD"
-
     def test_create_price_with_zero_amount_raises_error(self):
         """Test creating price with zero amount raises error."""
         with pytest.raises(ValueError, match="Price cannot be zero"):
-            Price(amount=Decimal("0.00"), currency="USD")
-
-    def test_price_from_decimal(self):
-        """Test creating Price from Decimal."""
-        price = Price.from_decimal(Decimal("19.997"), "USD")
-
-        # Should round to 2 decimal places
-        assert price.amount == Decimal("20.00")
-
-    def test_price_from_float(self):
-        """Test creating Price from float."""
-        price = Price.from_float(29.99, "USD")
-
-        assert price.amount == Decimal("29.99")
-
-    def test_price_from_int_cents(self):
-        """Test creating Price from integer cents."""
-        price = Price.from_int(2999, "USD")  # 2999 cents = $29.99
-
-        assert price.amount == Decimal("29.99")
-
-    def test_price_from_int_with_rounding(self):
-        """Test Price from int handles rounding correctly."""
-        price = Price.from_int(2997, "USD")  # 2997 cents
-
-        assert price.amount == Decimal("29.97")
+            Price(amount=D_0_00, currency="USD")
+
+    @pytest.mark.parametrize(
+        "factory, arg, expected",
+        [
+            # from_decimal rounds to 2 decimal places
+            pytest.param("from_decimal", Decimal("19.997"), D_20_00, id="decimal-rounds"),
+            pytest.param("from_float", 29.99, D_29_99, id="float"),
+            # 2.675 is stored as 2.67499999...; rounding round(x * 100) gives 2.67
+            pytest.param("from_float", 2.675, Decimal("2.68"), id="float-shortest-repr"),
+            pytest.param("from_int", 2999, D_29_99, id="int-cents"),
+            pytest.param("from_int", 2997, Decimal("29.97"), id="int-cents-odd"),
+        ],
+    )
+    def test_price_factory(self, factory, arg, expected):
+        """Test Price factories convert and round amounts to cents."""
+        price = getattr(Price, factory)(arg, "USD")
+
+        assert price.amount == expected
+
+    def test_price_from_float_returns_new_instances(self):
+        """Test from_float builds a fresh price per call."""
+        assert Price.from_float(10.0, "USD") is not Price.from_float(10.0, "USD")
+        assert Price.from_float(10.0, "EUR").currency == "EUR"
+
+    def test_price_from_int_keeps_two_decimal_places(self):
+        """Test Price from whole-unit cents keeps cents precision."""
+        price = Price.from_int(1000, "USD")
+
+        assert price.amount.as_tuple() == D_10_00.as_tuple()
+
+    def test_price_from_int_equals_decimal_price(self):
+        """Test Price from cents equals the same Decimal price."""
+        price = Price.from_int(2999, "USD")
+
+        assert price == Price(amount=D_29_99, currency="USD")
+        assert hash(price) == hash(Price(amount=D_29_99, currency="USD"))
+
+    def test_price_from_int_zero_raises_error(self):
+        """Test Price from zero cents raises error."""
+        with pytest.raises(ValueError, match="Price cannot be zero"):
+            Price.from_int(0, "USD")
+
+    def test_price_cents(self):
+        """Test cents view for both construction paths."""
+        assert Price.from_int(2999, "USD").cents == 2999
+        assert Price(amount=D_29_99, currency="USD").cents == 2999
+
+    @pytest.mark.parametrize(
+        "amount, cents",
+        [
+            pytest.param("10.999", 1100, id="rounds-up"),
+            pytest.param("10.005", 1001, id="half-up"),
+            pytest.param("10.004", 1000, id="rounds-down"),
+        ],
+    )
+    def test_price_cents_rounds_sub_cent_amounts(self, amount, cents):
+        """Test cents rounds amounts with more than two decimals half up."""
+        assert Price(amount=Decimal(amount), currency="USD").cents == cents
+
+    @pytest.mark.parametrize(
+        "build",
+        [
+            pytest.param(lambda: Price(amount=Decimal("0.125"), currency="USD"), id="constructor"),
+            pytest.param(lambda: Price.from_decimal(Decimal("0.125")), id="from-decimal"),
+            pytest.param(lambda: Price.from_float(0.125), id="from-float"),
+        ],
+    )
+    def test_half_cent_rounds_half_up_on_every_path(self, build):
+        """Test a half-cent amount rounds the same way whichever path builds it."""
+        assert build().cents == 13
 
     def test_price_string_representation(self):
         """Test string representation of Price."""
-        price = Price(amount=Decimal("99.99"), currency="EUR")
+        price = Price(amount=D_99_99, currency="EUR")
 
         assert str(price) == "99.99 EUR"
 
@@ -129,13 +160,6 @@ class TestPrice:
 class TestProductName:
     """Test suite for ProductName value object."""
 
-    def test_create_valid_product_name(self):
-        """Test creating product name with valid value."""
-        name = ProductName(value="Laptop")
-
-        assert str(name) == "Laptop"
-        assert name.value == "Laptop"
-
     def test_create_product_name_with_whitespace_trims(self):
         """Test creating product name with whitespace trims it."""
         name = ProductName(value="  Laptop  ")
@@ -155,11 +179,11 @@ class TestProductName:
     def test_create_product_name_with_too_long_name_raises_error(self):
         """Test creating product name too long raises error."""
         with pytest.raises(ValueError, match="cannot exceed"):
-            ProductName(value="A" * 256)
+            ProductName(value=STR_256)
 
     def test_create_product_name_with_max_length(self):
         """Test creating product name with max length succeeds."""
-        name = ProductName(value="A" * 255)
+        name = ProductName(value=STR_255)
 
         assert len(str(name)) == 255
 
@@ -169,13 +193,6 @@ class TestProductName:
 
         assert len(str(name)) == 1
 
-    def test_product_name_is_immutable(self):
-        """Test that ProductName is frozen/immutable."""
-        name = ProductName(value="Laptop")
-
-        with pytest.raises(Exception):  # FrozenInstanceError
-            name.value = "Desktop"
-
 
 # ============================================================================
 # Description Value Object Tests
@@ -184,12 +201,6 @@ class TestProductName:
 class TestDescription:
     """Test suite for Description value object."""
 
-    def test_create_valid_description(self):
-        """Test creating description with valid value."""
-        description = Description(value="A great product")
-
-        assert str(description) == "A great product"
-
     def test_create_description_with_whitespace_trims(self):
         """Test creating description with whitespace trims it."""
         description = Description(value="  A great product  ")
@@ -205,21 +216,14 @@ class TestDescription:
     def test_create_description_with_too_long_text_raises_error(self):
         """Test creating description too long raises error."""
         with pytest.raises(ValueError, match="cannot exceed"):
-            Description(value="A" * 5001)
+            Description(value=STR_5001)
 
     def test_create_description_with_max_length(self):
         """Test creating description with max length succeeds."""
-        description = Description(value="A" * 5000)
+        description = Description(value=STR_5000)
 
         assert len(str(description)) == 5000
 
-    def test_description_is_immutable(self):
-        """Test that Description is frozen/immutable."""
-        description = Description(value="Original description")
-
-        with pytest.raises(Exception):  # FrozenInstanceError
-            description.value = "New description"
-
 
 # ============================================================================
 # Quantity Value Object Tests
@@ -228,12 +232,9 @@ class TestDescription:
 class TestQuantity:
     """Test suite for Quantity value object."""
 
-    def test_create_valid_quantity(self):
-        """Test creating quantity with valid value."""
-        quantity = Quantity(value=50)
-
-        assert quantity.value == 50
-        assert int(quantity) == 50
+    def test_quantity_converts_to_int(self):
+        """Test quantity converts to its integer value."""
+        assert int(Quantity(value=50)) == 50
 
     def test_create_quantity_with_minimum_value(self):
         """Test creating quantity with minimum value."""
@@ -262,61 +263,41 @@ class TestQuantity:
         with pytest.raises(ValueError, match="Quantity must be an integer"):
             Quantity(value=5.5)  # type: ignore
 
-    def test_add_quantities(self):
-        """Test adding two quantities."""
-        quantity1 = Quantity(value=100)
-        quantity2 = Quantity(value=250)
-
-        result = quantity1 + quantity2
-
-        assert result.value == 350
-
-    def test_add_quantities_exceeds_maximum_raises_error(self):
-        """Test adding quantities that exceed maximum raises error."""
-        quantity1 = Quantity(value=900000)
-        quantity2 = Quantity(value=200000)
-
-        with pytest.raises(ValueError, match="cannot exceed"):
-            _ = quantity1 + quantity2
-
-    def test_subtract_quantities(self):
-        """Test subtracting two quantities."""
-        quantity1 = Quantity(value=500)
-        quantity2 = Quantity(value=200)
-
-        result = quantity1 - quantity2
-
-        assert result.value == 300
-
-    def test_subtract_quantities_below_minimum_raises_error(self):
-        """Test subtracting quantities below minimum raises error."""
-        quantity1 = Quantity(value=10)
-        quantity2 = Quantity(value=10)
-
-        with pytest.raises(ValueError, match="too low"):
-            _ = quantity1 - quantity2
-
-    def test_quantity_is_immutable(self):
-        """Test that Quantity is frozen/immutable."""
-        quantity = Quantity(value=50)
-
-        with pytest.raises(Exception):  # FrozenInstanceError
-            quantity.value = 100
-
-    def test_quantity_equality(self):
+    @pytest.mark.parametrize(
+        "op, a, b, expected",
+        [
+            pytest.param(operator.add, 100, 250, 350, id="add"),
+            pytest.param(operator.sub, 500, 200, 300, id="subtract"),
+        ],
+    )
+    def test_quantity_arithmetic(self, op, a, b, expected):
+        """Test adding and subtracting quantities."""
+        result = op(Quantity(value=a), Quantity(value=b))
+
+        assert result.value == expected
+
+    @pytest.mark.parametrize(
+        "op, a, b, match",
+        [
+            pytest.param(operator.add, 900000, 200000, "cannot exceed", id="add-above-maximum"),
+            pytest.param(operator.sub, 10, 10, "too low", id="subtract-below-minimum"),
+        ],
+    )
+    def test_quantity_arithmetic_out_of_range_raises_error(self, op, a, b, match):
+        """Test arithmetic leaving the allowed range raises error."""
+        with pytest.raises(ValueError, match=match):
+            op(Quantity(value=a), Quantity(value=b))
+
+    def test_quantity_equality(self, quantity_set):
         """Test quantity equality."""
-        quantity1 = Quantity(value=100)
-        quantity2 = Quantity(value=100)
-        quantity3 = Quantity(value=200)
+        quantity1, quantity2, quantity3 = quantity_set
 
         assert quantity1 == quantity2
         assert quantity1 != quantity3
 
-    def test_quantity_hash(self):
+    def test_quantity_hash(self, quantity_set):
         """Test quantity can be used in sets and as dict keys."""
-        quantity1 = Quantity(value=100)
-        quantity2 = Quantity(value=100)
-        quantity3 = Quantity(value=200)
+        quantity1, quantity2, quantity3 = quantity_set
 
         # Can be used in set
         quantities = {quantity1, quantity2, quantity3}
@@ -325,3 +306,69 @@ class TestQuantity:
         # Can be used as dict key
         quantity_dict = {quantity1: "first", quantity3: "second"}
         assert quantity_dict[quantity2] == "first"
+
+    def test_quantity_uses_slots(self):
+        """Test quantity has no per-instance __dict__ and no limit fields."""
+        quantity = Quantity(value=100)
+
+        assert not hasattr(quantity, "__dict__")
+        assert repr(quantity) == "Quantity(value=100)"
+
+
+# ============================================================================
+# Shared Value Object Tests
+# ============================================================================
+
+class TestValueObjectCreation:
+    """Test suite for constructing value objects from valid input."""
+
+    @pytest.mark.parametrize(
+        "cls, kwargs, expected_attrs",
+        [
+            pytest.param(
+                Money, {"amount": D_100_50, "currency": "USD"},
+                {"amount": D_100_50, "currency": "USD"}, id="money",
+            ),
+            pytest.param(
+                Price, {"amount": D_29_99, "currency": "USD"},
+                {"amount": D_29_99, "currency": "USD"}, id="price",
+            ),
+            pytest.param(ProductName, {"value": "Laptop"}, {"value": "Laptop"}, id="product-name"),
+            pytest.param(
+                Description, {"value": "A great product"}, {"value": "A great product"},
+                id="description",
+            ),
+            pytest.param(Quantity, {"value": 50}, {"value": 50}, id="quantity"),
+        ],
+    )
+    def test_create_valid_value_object(self, cls, kwargs, expected_attrs):
+        """Test creating value objects with valid input keeps the given values."""
+        obj = cls(**kwargs)
+
+        assert {attr: getattr(obj, attr) for attr in expected_attrs} == expected_attrs
+
+
+class TestValueObjectImmutability:
+    """Test suite for frozen value objects."""
+
+    @pytest.mark.parametrize(
+        "obj, attr, new_value",
+        [
+            pytest.param(Money(amount=D_10_00, currency="USD"), "amount", D_20_00, id="money"),
+            pytest.param(Price(amount=D_29_99, currency="USD"), "amount", D_99_99, id="price"),
+            pytest.param(ProductName(value="Laptop"), "value", "Desktop", id="product-name"),
+            pytest.param(
+                Description(value="Original description"), "value", "New description",
+                id="description",
+            ),
+            pytest.param(Quantity(value=50), "value", 100, id="quantity"),
+        ],
+    )
+    def test_value_object_is_immutable(self, obj, attr, new_value):
+        """Test that value objects are frozen/immutable."""
+        old_value = getattr(obj, attr)
+
+        with pytest.raises(FrozenInstanceError):
+            setattr(obj, attr, new_value)
+
+        assert getattr(obj, attr) == old_value
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Coverage comparison script.
+
+Compares two coverage.py JSON reports and fails if executed lines differ.
+Used to check whether deselected tests add any line coverage.
+
+Usage:
+    pytest modules/cart/tests/unit --cov=modules.cart --cov-report=json:full.json
+    pytest modules/cart/tests/unit --cov=modules.cart --cov-report=json:trimmed.json \\
+        --deselect <test_node_id>
+    python scripts/compare_cov.py full.json trimmed.json
+"""
+
+import json
+import sys
+
+
+def load_executed_lines(path: str) -> dict[str, set[int]]:
+    """
+    Load executed lines per file from coverage JSON report.
+
+    Args:
+        path: Path to coverage JSON report
+
+    Returns:
+        Mapping of file path to set of executed line numbers
+    """
+    with open(path, encoding="utf-8") as f:
+        report = json.load(f)
+
+    return {
+        file_path: set(data["executed_lines"])
+        for file_path, data in report["files"].items()
+    }
+
+
+def compare_coverage(full_path: str, trimmed_path: str) -> bool:
+    """
+    Compare executed lines of two coverage reports.
+
+    Args:
+        full_path: Report of the full test run
+        trimmed_path: Report of the run with deselected tests
+
+    Returns:
+        True if both reports executed the same lines
+    """
+    full = load_executed_lines(full_path)
+    trimmed = load_executed_lines(trimmed_path)
+
+    identical = True
+    for file_path in sorted(full.keys() | trimmed.keys()):
+        missing = full.get(file_path, set()) - trimmed.get(file_path, set())
+        if missing:
+            identical = False
+            print(f"❌ {file_path}: lines only covered by full run: {sorted(missing)}")
+
+    if identical:
+        print("✅ Coverage is identical, deselected tests add no line coverage")
+
+    return identical
+
+
+def main() -> None:
+    """Main entry point."""
+    if len(sys.argv) != 3:
+        print("Usage: python scripts/compare_cov.py <full.json> <trimmed.json>")
+        sys.exit(2)
+
+    if not compare_coverage(sys.argv[1], sys.argv[2]):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
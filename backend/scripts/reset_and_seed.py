@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+Database reset-and-seed script.
+
+Drops and recreates the database, applies migrations, then seeds sample
+data - all in one process on one event loop.
+
+Run from the backend directory (alembic.ini is resolved relative to it):
+    python -m scripts.reset_and_seed
+
+WARNING: This will DELETE all data!
+"""
+
+import asyncio
+
+from alembic import command
+from alembic.config import Config
+
+from core.database import db_manager
+from scripts.reset_db import reset_database
+from scripts.seed_db import seed_database
+
+
+def run_migrations() -> None:
+    """Apply all migrations up to head."""
+    print("📦 Running migrations: alembic upgrade head")
+    # alembic env.py starts its own loop, so this must run between runner calls
+    command.upgrade(Config("alembic.ini"), "head")
+    print("   ✅ Migrations applied")
+    print()
+
+
+def main() -> None:
+    """Main entry point."""
+    with asyncio.Runner() as runner:
+        try:
+            runner.run(reset_database())
+            run_migrations()
+            runner.run(seed_database())
+        except Exception as e:
+            print(f"❌ Error: {e}")
+            raise
+        finally:
+            runner.run(db_manager.close())
+
+
+if __name__ == "__main__":
+    main()
@@ -25,20 +25,14 @@ async def reset_database() -> None:
     print(f"   Database: {settings.DB_HOST}:{settings.DB_PORT}/{settings.DB_NAME}")
     print()
 
-    # Step 1: Drop database
-    print("📦 Step 1/3: Dropping database if exists...")
-    await db_manager.drop_database()
-    print("   ✅ Database dropped")
+    # Step 1: Drop and create database over one admin connection
+    print("📦 Step 1/2: Dropping and recreating database...")
+    await db_manager.recreate_database()
+    print("   ✅ Database recreated")
     print()
 
-    # Step 2: Create database
-    print("📦 Step 2/3: Creating new database...")
-    await db_manager.create_database()
-    print("   ✅ Database created")
-    print()
-
-    # Step 3: Run migrations
-    print("📦 Step 3/3: Running migrations...")
+    # Step 2: Run migrations
+    print("📦 Step 2/2: Running migrations...")
     print("   ⚠️  Please run: alembic upgrade head")
     print()
 
@@ -16,7 +16,7 @@ from core.database import db_manager
 from modules.catalog.domain.entities import Category, Product
 from modules.catalog.domain.value_objects import Price
 from modules.catalog.infrastructure.orm import CategoryORM, ProductORM
-from sqlalchemy import select
+from sqlalchemy import insert, literal, select
 
 settings = get_settings()
 
@@ -41,21 +41,21 @@ PRODUCTS = [
     {
         "name": "iPhone 15 Pro",
         "description": "Latest iPhone with A17 Pro chip, titanium design, and advanced camera system.",
-        "price": 1199.00,
+        "price_cents": 119900,
         "stock": 50,
         "category_name": "Phones",
     },
     {
         "name": "Samsung Galaxy S24 Ultra",
         "description": "Premium Android smartphone with S Pen, 200MP camera, and AI features.",
-        "price": 1299.00,
+        "price_cents": 129900,
         "stock": 45,
         "category_name": "Phones",
     },
     {
         "name": "Google Pixel 8 Pro",
         "description": "Pure Android experience with advanced AI photography and 7 years of updates.",
-        "price": 999.00,
+        "price_cents": 99900,
         "stock": 60,
         "category_name": "Phones",
     },
@@ -63,21 +63,21 @@ PRODUCTS = [
     {
         "name": "MacBook Pro 16\"",
         "description": "Powerful laptop with M3 Max chip, stunning Liquid Retina XDR display.",
-        "price": 2499.00,
+        "price_cents": 249900,
         "stock": 30,
         "category_name": "Laptops",
     },
     {
         "name": "Dell XPS 15",
         "description": "Windows laptop with InfinityEdge display and powerful performance.",
-        "price": 1899.00,
+        "price_cents": 189900,
         "stock": 40,
         "category_name": "Laptops",
     },
     {
         "name": "ThinkPad X1 Carbon",
         "description": "Business laptop with legendary keyboard, lightweight, durable design.",
-        "price": 1649.00,
+        "price_cents": 164900,
         "stock": 35,
         "category_name": "Laptops",
     },
@@ -85,21 +85,21 @@ PRODUCTS = [
     {
         "name": "AirPods Pro 2",
         "description": "Premium wireless earbuds with active noise cancellation and spatial audio.",
-        "price": 249.00,
+        "price_cents": 24900,
         "stock": 100,
         "category_name": "Accessories",
     },
     {
         "name": "Sony WH-1000XM5",
         "description": "Best-in-class noise canceling headphones with exceptional sound quality.",
-        "price": 399.00,
+        "price_cents": 39900,
         "stock": 75,
         "category_name": "Accessories",
     },
     {
         "name": "MagSafe Charger",
         "description": "Wireless charger for iPhone with fast charging support.",
-        "price": 39.00,
+        "price_cents": 3900,
         "stock": 150,
         "category_name": "Accessories",
     },
@@ -107,21 +107,21 @@ PRODUCTS = [
     {
         "name": "Classic Fit T-Shirt",
         "description": "Comfortable 100% cotton t-shirt, available in multiple colors.",
-        "price": 29.99,
+        "price_cents": 2999,
         "stock": 200,
         "category_name": "Men",
     },
     {
         "name": "Slim Fit Jeans",
         "description": "Modern stretch denim jeans with comfortable fit.",
-        "price": 79.99,
+        "price_cents": 7999,
         "stock": 150,
         "category_name": "Men",
     },
     {
         "name": "Hooded Sweatshirt",
         "description": "Soft fleece hoodie with kangaroo pocket.",
-        "price": 59.99,
+        "price_cents": 5999,
         "stock": 120,
         "category_name": "Men",
     },
@@ -129,21 +129,21 @@ PRODUCTS = [
     {
         "name": "Floral Dress",
         "description": "Elegant summer dress with floral pattern.",
-        "price": 89.99,
+        "price_cents": 8999,
         "stock": 80,
         "category_name": "Women",
     },
     {
         "name": "Yoga Leggings",
         "description": "High-waisted leggings with 4-way stretch.",
-        "price": 49.99,
+        "price_cents": 4999,
         "stock": 180,
         "category_name": "Women",
     },
     {
         "name": "Cardigan Sweater",
         "description": "Cozy knit cardigan with button front.",
-        "price": 69.99,
+        "price_cents": 6999,
         "stock": 100,
         "category_name": "Women",
     },
@@ -151,14 +151,14 @@ PRODUCTS = [
     {
         "name": "Kids Sneakers",
         "description": "Comfortable running shoes with non-slip soles.",
-        "price": 39.99,
+        "price_cents": 3999,
         "stock": 90,
         "category_name": "Kids",
     },
     {
         "name": "Cartoon T-Shirt",
         "description": "Fun graphic t-shirt with favorite characters.",
-        "price": 19.99,
+        "price_cents": 1999,
         "stock": 130,
         "category_name": "Kids",
     },
@@ -166,21 +166,21 @@ PRODUCTS = [
     {
         "name": "Premium Coffee Beans",
         "description": "100% Arabica coffee beans, medium roast, 1kg pack.",
-        "price": 24.99,
+        "price_cents": 2499,
         "stock": 250,
         "category_name": "Beverages",
     },
     {
         "name": "Green Tea Collection",
         "description": "Assorted green tea bags, 50 count.",
-        "price": 14.99,
+        "price_cents": 1499,
         "stock": 200,
         "category_name": "Beverages",
     },
     {
         "name": "Organic Juice Pack",
         "description": "Mixed fruit juice, 6 x 1L bottles.",
-        "price": 18.99,
+        "price_cents": 1899,
         "stock": 180,
         "category_name": "Beverages",
     },
@@ -188,21 +188,21 @@ PRODUCTS = [
     {
         "name": "Mixed Nuts",
         "description": "Premium roasted nuts assortment, 500g.",
-        "price": 12.99,
+        "price_cents": 1299,
         "stock": 220,
         "category_name": "Snacks",
     },
     {
         "name": "Dark Chocolate",
         "description": "Belgian dark chocolate 70% cocoa, 200g.",
-        "price": 8.99,
+        "price_cents": 899,
         "stock": 300,
         "category_name": "Snacks",
     },
     {
         "name": "Protein Bars",
         "description": "Healthy protein bars, pack of 12.",
-        "price": 29.99,
+        "price_cents": 2999,
         "stock": 160,
         "category_name": "Snacks",
     },
@@ -214,49 +214,47 @@ async def seed_database() -> None:
     print("🌱 Starting database seeding...")
     print()
 
-    async for db in db_manager.get_session():
+    async with db_manager.session() as db:
         # Check if data already exists
-        result = await db.execute(select(CategoryORM).limit(1))
-        if result.scalar_one_or_none():
+        result = await db.execute(select(literal(1)).select_from(CategoryORM).limit(1))
+        if result.scalar_one_or_none() is not None:
             print("⚠️  Database already contains data. Skipping seeding.")
             return
 
-        # Create categories
+        # Create categories in one bulk INSERT
         print("📁 Creating categories...")
-        category_map: dict[str, str] = {}
+        category_rows = [
+            {"id": uuid4(), "name": cat_data["name"], "parent_id": cat_data["parent_id"]}
+            for cat_data in CATEGORIES
+        ]
+        await db.execute(insert(CategoryORM), category_rows)
+        category_map: dict[str, UUID] = {row["name"]: row["id"] for row in category_rows}
 
-        for cat_data in CATEGORIES:
-            category = CategoryORM(
-                id=str(uuid4()),
-                name=cat_data["name"],
-                parent_id=cat_data["parent_id"],
-            )
-            db.add(category)
-            category_map[cat_data["name"]] = category.id
-            print(f"   ✓ {cat_data['name']}")
-
-        await db.commit()
+        print("\n".join(f"   ✓ {row['name']}" for row in category_rows))
         print(f"   ✅ Created {len(CATEGORIES)} categories")
         print()
 
-        # Create products
+        # Create products in one bulk INSERT
         print("📦 Creating products...")
-        for prod_data in PRODUCTS:
-            category_id = category_map.get(prod_data["category_name"])
-
-            product = ProductORM(
-                id=str(uuid4()),
-                name=prod_data["name"],
-                description=prod_data["description"],
-                price=int(prod_data["price"] * 100),  # Convert to cents
-                currency="USD",
-                category_id=category_id,
-                stock=prod_data["stock"],
-            )
-            db.add(product)
-            print(f"   ✓ {prod_data['name']} (${prod_data['price']})")
+        product_rows = [
+            {
+                "id": uuid4(),
+                "name": prod_data["name"],
+                "description": prod_data["description"],
+                "price": prod_data["price_cents"],
+                "currency": "USD",
+                "category_id": category_map.get(prod_data["category_name"]),
+                "stock": prod_data["stock"],
+            }
+            for prod_data in PRODUCTS
+        ]
+        # Both inserts commit together when the session block exits
+        await db.execute(insert(ProductORM), product_rows)
 
-        await db.commit()
+        print("\n".join(
+            f"   ✓ {prod_data['name']} (${prod_data['price_cents'] / 100:.2f})"
+            for prod_data in PRODUCTS
+        ))
         print(f"   ✅ Created {len(PRODUCTS)} products")
         print()
 
@@ -0,0 +1,6 @@
+"""
+Shared test support for all modules.
+
+Helpers used by more than one module's test suite live here, so module
+test packages never import from each other.
+"""
@@ -0,0 +1,35 @@
+"""
+Lightweight fakes shared across module test suites.
+
+Provides cheap async repository stubs.
+"""
+
+from types import SimpleNamespace
+
+
+def make_fake_repo(*method_names: str) -> SimpleNamespace:
+    """
+    Build a lightweight repository stub with async methods.
+
+    Each method records ``(args, kwargs)`` in ``fake.calls[name]`` and
+    returns ``fake.returns[name]`` (None until configured). Much cheaper
+    to build than Mock(spec=...) with AsyncMock attributes.
+    """
+    fake = SimpleNamespace(calls={name: [] for name in method_names}, returns={})
+
+    def make_method(name: str):
+        async def method(*args, **kwargs):
+            fake.calls[name].append((args, kwargs))
+            return fake.returns.get(name)
+
+        return method
+
+    for name in method_names:
+        setattr(fake, name, make_method(name))
+
+    return fake
+
+
+def make_fake_product_repo() -> SimpleNamespace:
+    """Build product repository stub."""
+    return make_fake_repo("get_by_id", "get_all", "list_with_count", "search", "count")